@@ -1,4 +1,5 @@
 """This package contains the API routing layer."""
 from .routes import api_router
+from .dependencies import get_services, get_health_service, get_user_service
 
-__all__ = ["api_router"]
+__all__ = ["api_router", "get_services", "get_health_service", "get_user_service"]
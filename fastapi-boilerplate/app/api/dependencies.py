@@ -0,0 +1,30 @@
+from fastapi import Request
+
+from app import services
+
+# These providers are `async def` on purpose: FastAPI runs plain `def`
+# dependencies in a threadpool, which would add a thread hop to every request
+# just to return an object that already exists.
+
+
+async def get_services(request: Request) -> services.ServiceContainer:
+    """
+    Returns the application-scoped service container built in the lifespan.
+    """
+    return request.app.state.services
+
+
+async def get_health_service(request: Request) -> services.HealthService:
+    """
+    Returns the shared HealthService instance.
+    Override with `app.dependency_overrides[get_health_service]` in tests.
+    """
+    return request.app.state.services.health_service
+
+
+async def get_user_service(request: Request) -> services.UserService:
+    """
+    Returns the shared UserService instance.
+    Override with `app.dependency_overrides[get_user_service]` in tests.
+    """
+    return request.app.state.services.user_service
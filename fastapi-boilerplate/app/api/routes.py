@@ -4,6 +4,7 @@ from opentelemetry import trace
 
 from app import schemas
 from app import services
+from .dependencies import get_health_service, get_user_service
 
 api_router = APIRouter()
 tracer = trace.get_tracer(__name__)
@@ -18,7 +19,7 @@ tracer = trace.get_tracer(__name__)
     status_code=status.HTTP_200_OK, 
     tags=["Health"]
 )
-async def health_check(health_service: services.HealthService = Depends()) -> schemas.HealthStatus:
+async def health_check(health_service: services.HealthService = Depends(get_health_service)) -> schemas.HealthStatus:
     """
     Endpoint to check the health of the application.
     It delegates the actual health check logic to the HealthService.
@@ -38,7 +39,7 @@ async def health_check(health_service: services.HealthService = Depends()) -> sc
 )
 async def create_user(
     user: schemas.UserCreate, 
-    user_service: services.UserService = Depends()
+    user_service: services.UserService = Depends(get_user_service)
 ) -> schemas.UserDisplay:
     """
     Endpoint to create a new user.
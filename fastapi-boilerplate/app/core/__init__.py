@@ -1,9 +1,24 @@
 """
 This package contains the core, cross-cutting concerns of the application,
-such as configuration, logging, and tracing.
+such as configuration, logging, tracing, metrics, background jobs, and outbound HTTP.
 """
 from .config import settings
 from .logging_config import configure_logging
-from .tracing_config import configure_tracing
+from .tracing_config import configure_tracing, traced, traced_span
+from .metrics_config import configure_metrics
+from .task_queue import JobQueue
+from .compression import CompressionMiddleware
+from .http_client import CircuitOpenError, HttpClient
 
-__all__ = ["settings", "configure_logging", "configure_tracing"]
+__all__ = [
+    "settings",
+    "configure_logging",
+    "configure_tracing",
+    "configure_metrics",
+    "traced",
+    "traced_span",
+    "JobQueue",
+    "CompressionMiddleware",
+    "HttpClient",
+    "CircuitOpenError",
+]
@@ -0,0 +1,301 @@
+import gzip
+import zlib
+from typing import Dict, Iterable, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .config import settings
+
+# Brotli and Zstandard are optional; their encodings are only offered when installed.
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+
+class GzipEncoder:
+    """Gzip content encoding backed by the standard library."""
+    name = "gzip"
+
+    def __init__(self, level: int):
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return gzip.compress(data, compresslevel=self.level, mtime=0)
+
+    def stream(self) -> "_ZlibStream":
+        return _ZlibStream(zlib.compressobj(self.level, zlib.DEFLATED, zlib.MAX_WBITS | 16))
+
+
+class _ZlibStream:
+    def __init__(self, compressor):
+        self._compressor = compressor
+
+    def write(self, chunk: bytes) -> bytes:
+        return self._compressor.compress(chunk) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliEncoder:
+    """Brotli content encoding. Requires the `brotli` package."""
+    name = "br"
+
+    def __init__(self, quality: int):
+        self.quality = quality
+
+    def compress(self, data: bytes) -> bytes:
+        return brotli.compress(data, quality=self.quality)
+
+    def stream(self) -> "_BrotliStream":
+        return _BrotliStream(brotli.Compressor(quality=self.quality))
+
+
+class _BrotliStream:
+    def __init__(self, compressor):
+        self._compressor = compressor
+
+    def write(self, chunk: bytes) -> bytes:
+        return self._compressor.process(chunk) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdEncoder:
+    """Zstandard content encoding. Requires the `zstandard` package."""
+    name = "zstd"
+
+    def __init__(self, level: int):
+        self.level = level
+        self._compressor = zstandard.ZstdCompressor(level=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def stream(self) -> "_ZstdStream":
+        return _ZstdStream(zstandard.ZstdCompressor(level=self.level).compressobj())
+
+
+class _ZstdStream:
+    def __init__(self, compressor):
+        self._compressor = compressor
+
+    def write(self, chunk: bytes) -> bytes:
+        return self._compressor.compress(chunk) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def available_encoders(
+    gzip_level: int, brotli_quality: int, zstd_level: int
+) -> list:
+    """
+    Returns the installed encoders in server preference order.
+    """
+    encoders = []
+    if zstandard is not None:
+        encoders.append(ZstdEncoder(zstd_level))
+    if brotli is not None:
+        encoders.append(BrotliEncoder(brotli_quality))
+    encoders.append(GzipEncoder(gzip_level))
+    return encoders
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """
+    Parses an Accept-Encoding header into a mapping of coding to q-value.
+    """
+    preferences = {}
+    for part in header.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        preferences[coding] = quality
+    return preferences
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware that compresses responses with the best encoding the
+    client accepts (zstd, br or gzip, depending on what is installed).
+
+    - Only bodies whose media type starts with one of `content_types`, and
+      none of `excluded_content_types` (e.g. `text/event-stream`), are
+      compressed, and single-message bodies smaller than `minimum_size`
+      are sent as-is.
+    - Streaming bodies are compressed chunk by chunk and flushed as they go.
+    - Compressed responses for `cache_paths` (e.g. `/openapi.json`) are kept
+      in memory per encoding, so static payloads are compressed only once.
+
+    Add it before `CORSMiddleware` so that cached responses still pass
+    through the per-request CORS handling.
+    """
+
+    _NEGOTIATION_CACHE_SIZE = 256
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: Optional[int] = None,
+        content_types: Optional[Iterable[str]] = None,
+        excluded_content_types: Optional[Iterable[str]] = None,
+        gzip_level: Optional[int] = None,
+        brotli_quality: Optional[int] = None,
+        zstd_level: Optional[int] = None,
+        cache_paths: Iterable[str] = (),
+    ):
+        self.app = app
+        self.minimum_size = settings.COMPRESSION_MINIMUM_SIZE if minimum_size is None else minimum_size
+        self.content_types = tuple(content_types or settings.COMPRESSION_CONTENT_TYPES)
+        self.excluded_content_types = tuple(
+            settings.COMPRESSION_EXCLUDED_CONTENT_TYPES
+            if excluded_content_types is None
+            else excluded_content_types
+        )
+        self.encoders = available_encoders(
+            settings.COMPRESSION_GZIP_LEVEL if gzip_level is None else gzip_level,
+            settings.COMPRESSION_BROTLI_QUALITY if brotli_quality is None else brotli_quality,
+            settings.COMPRESSION_ZSTD_LEVEL if zstd_level is None else zstd_level,
+        )
+        self.cache_paths = frozenset(cache_paths)
+        self._cache: Dict[Tuple[str, str], Tuple[Message, bytes]] = {}
+        self._negotiated: Dict[str, Optional[object]] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoder = self.negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if encoder is None:
+            await self.app(scope, receive, send)
+            return
+
+        cache_key = None
+        if scope["method"] == "GET" and scope["path"] in self.cache_paths:
+            cache_key = (scope["path"], encoder.name)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                start_message, body = cached
+                # Outer middleware may add headers, so never hand out the cached list itself.
+                await send({**start_message, "headers": list(start_message["headers"])})
+                await send({"type": "http.response.body", "body": body})
+                return
+
+        responder = _CompressionResponder(self, encoder, cache_key, send)
+        await self.app(scope, receive, responder.send)
+
+    def negotiate(self, accept_encoding: str):
+        """
+        Picks the encoder for an Accept-Encoding header, or None.
+        Results are memoized since clients send a handful of distinct values.
+        """
+        try:
+            return self._negotiated[accept_encoding]
+        except KeyError:
+            pass
+
+        preferences = parse_accept_encoding(accept_encoding)
+        wildcard = preferences.get("*", 0.0)
+        chosen, best = None, 0.0
+        for encoder in self.encoders:
+            quality = preferences.get(encoder.name, wildcard)
+            if quality > best:
+                chosen, best = encoder, quality
+
+        if len(self._negotiated) >= self._NEGOTIATION_CACHE_SIZE:
+            self._negotiated.clear()
+        self._negotiated[accept_encoding] = chosen
+        return chosen
+
+    def should_compress(self, headers: Headers) -> bool:
+        if "content-encoding" in headers:
+            return False
+        media_type = headers.get("content-type", "").split(";", 1)[0].strip().lower()
+        return media_type.startswith(self.content_types) and not media_type.startswith(
+            self.excluded_content_types
+        )
+
+
+class _CompressionResponder:
+    """Per-response state for CompressionMiddleware."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoder, cache_key, send: Send):
+        self.middleware = middleware
+        self.encoder = encoder
+        self.cache_key = cache_key
+        self.downstream = send
+        self.start_message: Optional[Message] = None
+        self.stream = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            self.start_message = message
+            return
+
+        if message_type != "http.response.body" or self.passthrough:
+            await self._flush_start()
+            await self.downstream(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.stream is not None:
+            chunk = self.stream.write(body) if more_body else self.stream.write(body) + self.stream.finish()
+            await self.downstream({"type": "http.response.body", "body": chunk, "more_body": more_body})
+            return
+
+        # First body message: decide whether this response gets compressed.
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        if not self.middleware.should_compress(headers) or (
+            not more_body and len(body) < self.middleware.minimum_size
+        ):
+            self.passthrough = True
+            await self._flush_start()
+            await self.downstream(message)
+            return
+
+        headers["Content-Encoding"] = self.encoder.name
+        headers.add_vary_header("Accept-Encoding")
+
+        if not more_body:
+            compressed = self.encoder.compress(body)
+            headers["Content-Length"] = str(len(compressed))
+            if self.cache_key is not None and self.start_message["status"] == 200:
+                cached_start = {**self.start_message, "headers": list(self.start_message["headers"])}
+                self.middleware._cache[self.cache_key] = (cached_start, compressed)
+            await self._flush_start()
+            await self.downstream({"type": "http.response.body", "body": compressed})
+            return
+
+        if "content-length" in headers:
+            del headers["Content-Length"]
+        self.stream = self.encoder.stream()
+        await self._flush_start()
+        await self.downstream({"type": "http.response.body", "body": self.stream.write(body), "more_body": True})
+
+    async def _flush_start(self) -> None:
+        if self.start_message is not None:
+            message, self.start_message = self.start_message, None
+            await self.downstream(message)
@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from enum import Enum
-from typing import Optional, List
+from typing import Dict, List, Optional
 
 class LogLevel(str, Enum):
     DEBUG = "DEBUG"
@@ -15,11 +15,59 @@ class Settings(BaseSettings):
     # Logging configuration
     LOG_LEVEL: LogLevel = LogLevel.INFO
     LOGURU_JSON_LOGS: bool = False
+    # Walk stack frames to find the caller of each stdlib log record. When
+    # disabled, the origin is taken from the record itself.
+    LOG_INTERCEPT_RESOLVE_CALLER: bool = True
+    # Per-logger levels applied in stdlib logging, e.g. {"uvicorn.access": "WARNING"}
+    LOG_LEVEL_OVERRIDES: Dict[str, LogLevel] = {}
+    # Disable uvicorn's access log and log one line per request from the app's middleware
+    LOG_REPLACE_UVICORN_ACCESS: bool = False
 
     # OpenTelemetry configuration
     OTEL_SERVICE_NAME: str = "fastapi-boilerplate"
     OTEL_EXPORTER_OTLP_ENDPOINT: Optional[str] = None
     OTEL_DEBUG_LOG_SPANS: bool = False
+    OTEL_METRIC_EXPORT_INTERVAL_SECONDS: float = 60.0
+
+    # Background job queue configuration
+    JOB_QUEUE_MAX_SIZE: int = 1000
+    JOB_QUEUE_CONCURRENCY: int = 4
+    JOB_QUEUE_MAX_RETRIES: int = 3
+    JOB_QUEUE_RETRY_BACKOFF_SECONDS: float = 0.5
+    JOB_QUEUE_SPOOL_PATH: str = "job_spool.sqlite3"
+    JOB_QUEUE_DRAIN_TIMEOUT_SECONDS: float = 10.0
+    JOB_QUEUE_POLL_INTERVAL_SECONDS: float = 5.0
+    JOB_QUEUE_DEAD_RETENTION_SECONDS: float = 7 * 24 * 60 * 60
+
+    # Response compression configuration
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_CONTENT_TYPES: List[str] = [
+        "application/json",
+        "application/javascript",
+        "image/svg+xml",
+        "text/",
+    ]
+    # Never compressed, even if allowed above. Server-sent events must reach
+    # the client as each event is sent, which a compressor would hold back.
+    COMPRESSION_EXCLUDED_CONTENT_TYPES: List[str] = ["text/event-stream"]
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
+    # Outbound HTTP client configuration
+    HTTP_CLIENT_HTTP2: bool = False
+    HTTP_CLIENT_TIMEOUT_SECONDS: float = 10.0
+    HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS: float = 3.0
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 100
+    HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST: int = 20
+    HTTP_CLIENT_MAX_RETRIES: int = 2
+    HTTP_CLIENT_RETRY_BACKOFF_SECONDS: float = 0.1
+    HTTP_CLIENT_RETRY_BACKOFF_MAX_SECONDS: float = 2.0
+    HTTP_CLIENT_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    HTTP_CLIENT_CIRCUIT_RESET_SECONDS: float = 30.0
 
     # CORS configuration
     ALLOWED_ORIGINS: List[str] = ["http://localhost:3000"]
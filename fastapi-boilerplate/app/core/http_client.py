@@ -0,0 +1,187 @@
+import asyncio
+import random
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+from loguru import logger
+from opentelemetry import propagate, trace
+
+from .config import settings
+
+tracer = trace.get_tracer(__name__)
+
+RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is rejected because the host's circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for a single downstream host.
+
+    After `failure_threshold` consecutive failed calls the circuit opens and
+    calls are rejected for `reset_timeout` seconds. It then goes half-open:
+    a single probe call is let through while other calls keep being rejected
+    for another `reset_timeout`. A successful probe closes the circuit, a
+    failed one re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._half_open = False
+
+    @property
+    def state(self) -> str:
+        """One of "closed", "open" or "half_open"."""
+        if self._opened_at is None:
+            return "closed"
+        return "half_open" if self._half_open else "open"
+
+    def allow_request(self) -> bool:
+        """
+        Returns whether a call may be sent now. Once the reset timeout has
+        passed, only the first caller is allowed through, as the probe.
+        """
+        if self._opened_at is None:
+            return True
+        now = time.monotonic()
+        if now - self._opened_at < self.reset_timeout:
+            return False
+        # Half-open: this caller is the probe; restarting the window holds the rest back
+        self._opened_at = now
+        self._half_open = True
+        return True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._half_open = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._half_open or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+            self._half_open = False
+
+
+class HttpClient:
+    """
+    Shared, pooled async HTTP client for calls to downstream services.
+
+    Create one instance per process and reuse it, so connections are kept
+    alive across requests instead of paying a TCP/TLS handshake per call.
+    On top of the httpx connection pool it adds:
+    - A concurrency limit per host.
+    - Retries with jittered exponential backoff for idempotent methods, on
+      transport errors and 502/503/504 responses.
+    - A circuit breaker per host.
+    - A client span per request, with the trace context injected into the
+      outgoing headers.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "",
+        client: Optional[httpx.AsyncClient] = None,
+        max_retries: Optional[int] = None,
+        retry_backoff: Optional[float] = None,
+    ):
+        self._client = client or httpx.AsyncClient(
+            base_url=base_url,
+            http2=settings.HTTP_CLIENT_HTTP2,
+            timeout=httpx.Timeout(
+                settings.HTTP_CLIENT_TIMEOUT_SECONDS,
+                connect=settings.HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS,
+            ),
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+        )
+        self._max_retries = settings.HTTP_CLIENT_MAX_RETRIES if max_retries is None else max_retries
+        self._retry_backoff = (
+            settings.HTTP_CLIENT_RETRY_BACKOFF_SECONDS if retry_backoff is None else retry_backoff
+        )
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Sends a request and returns the response. Raises CircuitOpenError if
+        the host's circuit is open, or the last httpx.TransportError once the
+        retries are used up. Retryable status codes are returned as responses.
+        """
+        method = method.upper()
+        request_url = self._client.base_url.join(url)
+        host = request_url.host
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = CircuitBreaker(
+                settings.HTTP_CLIENT_CIRCUIT_FAILURE_THRESHOLD,
+                settings.HTTP_CLIENT_CIRCUIT_RESET_SECONDS,
+            )
+        host_limit = self._host_limits.get(host)
+        if host_limit is None:
+            host_limit = self._host_limits[host] = asyncio.Semaphore(
+                settings.HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST
+            )
+        retries = self._max_retries if method in IDEMPOTENT_METHODS else 0
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        with tracer.start_as_current_span(f"HTTP {method}", kind=trace.SpanKind.CLIENT) as span:
+            if span.is_recording():
+                span.set_attributes({"http.request.method": method, "url.full": str(request_url)})
+            propagate.inject(headers)
+
+            if not breaker.allow_request():
+                raise CircuitOpenError(f"Circuit breaker for '{host}' is open.")
+
+            # The breaker sees one outcome per call, once its retries are used up
+            for attempt in range(retries + 1):
+                try:
+                    async with host_limit:
+                        response = await self._client.request(method, request_url, headers=headers, **kwargs)
+                except httpx.TransportError as exc:
+                    if attempt == retries:
+                        breaker.record_failure()
+                        raise
+                    logger.warning(f"{method} {request_url} failed with {exc!r}; retrying.")
+                    await asyncio.sleep(self._backoff(attempt))
+                    continue
+
+                if response.status_code not in RETRYABLE_STATUS_CODES or attempt == retries:
+                    break
+                logger.warning(f"{method} {request_url} returned {response.status_code}; retrying.")
+                await response.aclose()
+                await asyncio.sleep(self._backoff(attempt))
+
+            if response.status_code in RETRYABLE_STATUS_CODES:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+            span.set_attribute("http.response.status_code", response.status_code)
+            return response
+
+    async def aclose(self) -> None:
+        """Closes all pooled connections."""
+        await self._client.aclose()
+
+    def _backoff(self, attempt: int) -> float:
+        # "Full jitter": a random delay up to the exponential backoff cap, so
+        # many clients retrying at once don't hit the host in lockstep.
+        cap = min(settings.HTTP_CLIENT_RETRY_BACKOFF_MAX_SECONDS, self._retry_backoff * 2 ** attempt)
+        return random.uniform(0, cap)
@@ -1,22 +1,56 @@
 import sys
 import logging
+from contextvars import ContextVar
+from typing import Dict, Optional, Union
 from loguru import logger
 from .config import settings
 from opentelemetry import trace
 
 
+# Stdlib record being forwarded by InterceptHandler with `resolve_caller`
+# disabled, read by the `_use_stdlib_origin` patcher.
+_stdlib_record: ContextVar[Optional[logging.LogRecord]] = ContextVar("_stdlib_record", default=None)
+
+
 class InterceptHandler(logging.Handler):
     """
     Intercepts standard logging messages and redirects them to Loguru.
     This handler is part of the setup to make Loguru the primary logger.
+
+    Loguru levels are looked up once per level name and cached. With
+    `resolve_caller` disabled, the per-record frame walk is skipped and the
+    origin shown in the log line is taken from the stdlib record instead
+    (logger name, function and line).
     """
 
+    def __init__(self, resolve_caller: bool = True, level: int = logging.NOTSET):
+        super().__init__(level)
+        self.resolve_caller = resolve_caller
+        self._levels: Dict[str, Union[str, int]] = {}
+
     def emit(self, record: logging.LogRecord):
         # Get corresponding Loguru level if it exists
         try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
+            level = self._levels[record.levelname]
+        except KeyError:
+            try:
+                level = logger.level(record.levelname).name
+            except ValueError:
+                level = record.levelno
+            self._levels[record.levelname] = level
+
+        if not self.resolve_caller:
+            # Handed to the patcher through a context variable: cheaper than
+            # building a patched Logger with `logger.patch()` for every record.
+            token = _stdlib_record.set(record)
+            try:
+                if record.exc_info:
+                    logger.opt(exception=record.exc_info).log(level, record.getMessage())
+                else:
+                    logger.log(level, record.getMessage())
+            finally:
+                _stdlib_record.reset(token)
+            return
 
         # Find caller from where originated the logged message
         frame, depth = logging.currentframe(), 0
@@ -27,6 +61,18 @@ class InterceptHandler(logging.Handler):
         logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
 
 
+def _use_stdlib_origin(record) -> None:
+    """
+    Loguru patcher that reports the origin of the stdlib record being
+    forwarded by InterceptHandler, if any, as the log origin.
+    """
+    stdlib_record = _stdlib_record.get()
+    if stdlib_record is not None:
+        record["name"] = stdlib_record.name
+        record["function"] = stdlib_record.funcName
+        record["line"] = stdlib_record.lineno
+
+
 def trace_context_processor(record):
     """
     Loguru processor to add OpenTelemetry trace and span IDs to the log record.
@@ -42,6 +88,14 @@ def trace_context_processor(record):
         record["extra"].setdefault("span_id", "N/A")
 
 
+def patch_record(record) -> None:
+    """
+    The Loguru patcher installed by `configure_logging`.
+    """
+    trace_context_processor(record)
+    _use_stdlib_origin(record)
+
+
 def configure_logging():
     """
     Configures the Loguru logger to be the primary logger for the application,
@@ -65,9 +119,23 @@ def configure_logging():
     )
 
     # Add processor for OpenTelemetry context. This is more efficient and thread-safe.
-    logger.configure(patcher=trace_context_processor)
+    logger.configure(patcher=patch_record)
+
+    # Intercept standard logging messages toward your configured loguru sinks.
+    # The root level matches the sink level, so stdlib records that would be
+    # dropped anyway are filtered before they are created.
+    logging.basicConfig(
+        handlers=[InterceptHandler(resolve_caller=settings.LOG_INTERCEPT_RESOLVE_CALLER)],
+        level=settings.LOG_LEVEL.value,
+        force=True,
+    )
+
+    # Apply per-logger levels, e.g. to quieten chatty third-party libraries
+    for name, level in settings.LOG_LEVEL_OVERRIDES.items():
+        logging.getLogger(name).setLevel(level.value)
 
-    # Intercept standard logging messages toward your configured loguru sinks
-    logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
+    # The request logging middleware emits the access line instead
+    if settings.LOG_REPLACE_UVICORN_ACCESS:
+        logging.getLogger("uvicorn.access").disabled = True
 
     logger.info("Logging configured successfully.")
\ No newline at end of file
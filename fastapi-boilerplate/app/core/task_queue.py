@@ -0,0 +1,412 @@
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from loguru import logger
+from opentelemetry import metrics
+
+from .config import settings
+
+meter = metrics.get_meter(__name__)
+queue_depth = meter.create_up_down_counter(
+    "jobs.queue.depth", unit="1", description="Jobs waiting for a worker."
+)
+job_latency = meter.create_histogram(
+    "jobs.latency", unit="ms", description="Time from enqueue to successful completion."
+)
+job_failures = meter.create_counter(
+    "jobs.failed", unit="1", description="Jobs that exhausted their retries."
+)
+
+JobHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+@dataclass
+class Job:
+    """A unit of deferred work, as held in memory by the queue."""
+    id: int
+    name: str
+    payload: Dict[str, Any]
+    attempts: int = 0
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class JobSpool:
+    """
+    SQLite-backed store for queued jobs, so pending work survives restarts.
+
+    Each row is owned by the process that queued it in memory. Rows without
+    an owner (released on shutdown, or spooled while the queue was full) and
+    rows owned by a process that no longer exists are claimed by the next
+    process with room for them. Dead rows are kept until purged or requeued.
+    All methods are blocking and meant to be called via `asyncio.to_thread`.
+    """
+
+    def __init__(self, path: str):
+        self._owner = os.getpid()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA busy_timeout=5000")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    owner INTEGER,
+                    dead INTEGER NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    failed_at REAL
+                )
+                """
+            )
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+            if "failed_at" not in columns:
+                # Spools created before dead-job retention existed
+                self._conn.execute("ALTER TABLE jobs ADD COLUMN failed_at REAL")
+
+    def add(self, name: str, payload: Dict[str, Any], owned: bool = True) -> int:
+        """Inserts a job, owned by this process unless `owned` is False."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO jobs (name, payload, owner, created_at) VALUES (?, ?, ?, ?)",
+                (name, json.dumps(payload), self._owner if owned else None, time.time()),
+            )
+            return cursor.lastrowid
+
+    def claim_pending(self, limit: Optional[int] = None) -> List[Job]:
+        """
+        Takes ownership of up to `limit` live jobs that are unowned or whose
+        owner has exited.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute(
+                    "SELECT id, name, payload, attempts, owner FROM jobs "
+                    "WHERE dead = 0 AND (owner IS NULL OR owner != ?) ORDER BY id",
+                    (self._owner,),
+                ).fetchall()
+                claimed = [row for row in rows if row[4] is None or not _pid_alive(row[4])]
+                if limit is not None:
+                    claimed = claimed[:limit]
+                self._conn.executemany(
+                    "UPDATE jobs SET owner = ? WHERE id = ?",
+                    [(self._owner, row[0]) for row in claimed],
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return [
+            Job(id=row[0], name=row[1], payload=json.loads(row[2]), attempts=row[3])
+            for row in claimed
+        ]
+
+    def complete(self, job_id: int) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+
+    def record_failure(self, job_id: int, attempts: int, dead: bool) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET attempts = ?, dead = ?, failed_at = ? WHERE id = ?",
+                (attempts, int(dead), time.time() if dead else None, job_id),
+            )
+
+    def release(self, job_id: Optional[int] = None) -> None:
+        """Gives up ownership of one live job, or of all live jobs owned by this process."""
+        with self._lock:
+            if job_id is None:
+                self._conn.execute(
+                    "UPDATE jobs SET owner = NULL WHERE owner = ? AND dead = 0", (self._owner,)
+                )
+            else:
+                self._conn.execute("UPDATE jobs SET owner = NULL WHERE id = ?", (job_id,))
+
+    def list_dead(self, limit: int = 100) -> List[Job]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, name, payload, attempts FROM jobs WHERE dead = 1 ORDER BY id LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [
+            Job(id=row[0], name=row[1], payload=json.loads(row[2]), attempts=row[3])
+            for row in rows
+        ]
+
+    def requeue_dead(self, job_ids: Optional[Sequence[int]] = None) -> int:
+        """Marks dead jobs (all, or those in `job_ids`) as live and unowned with no attempts."""
+        with self._lock:
+            query = "UPDATE jobs SET dead = 0, attempts = 0, owner = NULL, failed_at = NULL WHERE dead = 1"
+            if job_ids is None:
+                return self._conn.execute(query).rowcount
+            return self._conn.executemany(
+                f"{query} AND id = ?", [(job_id,) for job_id in job_ids]
+            ).rowcount
+
+    def purge_dead(self, older_than: float) -> int:
+        """Deletes dead jobs that failed more than `older_than` seconds ago."""
+        with self._lock:
+            return self._conn.execute(
+                "DELETE FROM jobs WHERE dead = 1 AND failed_at < ?", (time.time() - older_than,)
+            ).rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class JobQueue:
+    """
+    In-process async queue for work that should not delay the response,
+    such as welcome emails, audit writes and search indexing.
+
+    Jobs are referenced by a registered handler name plus a JSON-serializable
+    payload, and are written to a local SQLite spool before they are queued.
+    Enqueueing never waits for room: when the queue is full the job stays in
+    the spool and a poller queues it once workers catch up. Delivery is
+    at-least-once, so handlers should be idempotent.
+
+    Usage:
+        jobs.register("user.created", send_welcome_email)
+        await jobs.start()
+        await jobs.enqueue("user.created", {"user_id": 1})
+        await jobs.stop()
+    """
+
+    def __init__(
+        self,
+        spool_path: Optional[str] = None,
+        max_size: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        retry_backoff: Optional[float] = None,
+        poll_interval: Optional[float] = None,
+        dead_retention: Optional[float] = None,
+    ):
+        self._spool_path = spool_path or settings.JOB_QUEUE_SPOOL_PATH
+        self._max_size = max_size or settings.JOB_QUEUE_MAX_SIZE
+        self._concurrency = concurrency or settings.JOB_QUEUE_CONCURRENCY
+        self._max_retries = settings.JOB_QUEUE_MAX_RETRIES if max_retries is None else max_retries
+        self._retry_backoff = (
+            settings.JOB_QUEUE_RETRY_BACKOFF_SECONDS if retry_backoff is None else retry_backoff
+        )
+        self._poll_interval = poll_interval or settings.JOB_QUEUE_POLL_INTERVAL_SECONDS
+        self._dead_retention = (
+            settings.JOB_QUEUE_DEAD_RETENTION_SECONDS if dead_retention is None else dead_retention
+        )
+        self._queue: asyncio.Queue[Job] = asyncio.Queue(maxsize=self._max_size)
+        self._handlers: Dict[str, JobHandler] = {}
+        self._workers: List[asyncio.Task] = []
+        self._retries: set[asyncio.Task] = set()
+        self._inserts: set[asyncio.Task] = set()
+        self._poller: Optional[asyncio.Task] = None
+        self._reserved = 0
+        self._spool: Optional[JobSpool] = None
+
+    @property
+    def depth(self) -> int:
+        """Number of jobs waiting for a worker."""
+        return self._queue.qsize()
+
+    def register(self, name: str, handler: JobHandler) -> None:
+        """Registers the coroutine that runs jobs enqueued under `name`."""
+        self._handlers[name] = handler
+
+    async def start(self) -> None:
+        """Opens the spool, starts the workers and re-queues spooled jobs."""
+        self._spool = await asyncio.to_thread(JobSpool, self._spool_path)
+        # Rows owned by our pid were left by an earlier process that reused it
+        await asyncio.to_thread(self._spool.release)
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"job-worker-{i}")
+            for i in range(self._concurrency)
+        ]
+        recovered = await self._claim_spooled()
+        self._poller = asyncio.create_task(self._poll(), name="job-spool-poller")
+        logger.info(
+            f"Job queue started with {self._concurrency} workers; "
+            f"recovered {recovered} spooled jobs."
+        )
+
+    async def enqueue(self, name: str, payload: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Persists a job and queues it for a worker. Call this after the
+        surrounding write has committed. Never waits for room in the queue,
+        and the job is kept even if the caller is cancelled mid-call.
+        """
+        if name not in self._handlers:
+            raise ValueError(f"No handler registered for job '{name}'.")
+        if self._spool is None:
+            raise RuntimeError("JobQueue.start() must be called before enqueueing jobs.")
+
+        # Room is reserved before the insert, so the put after it cannot block
+        admit = self._room() > 0
+        if admit:
+            self._reserved += 1
+        task = asyncio.create_task(self._insert(name, payload or {}, admit))
+        self._inserts.add(task)
+        task.add_done_callback(self._inserts.discard)
+        return await asyncio.shield(task)
+
+    async def dead_jobs(self, limit: int = 100) -> List[Job]:
+        """Lists jobs that exhausted their retries, oldest first."""
+        return await asyncio.to_thread(self._spool.list_dead, limit)
+
+    async def requeue_dead(self, job_ids: Optional[Sequence[int]] = None) -> int:
+        """
+        Returns dead jobs (all, or those in `job_ids`) to the spool with a
+        fresh retry budget. The poller queues them. Returns the number requeued.
+        """
+        return await asyncio.to_thread(self._spool.requeue_dead, job_ids)
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Drains the queue for up to `timeout` seconds, then stops the workers.
+        Jobs still pending stay in the spool and run on the next start.
+        """
+        if self._spool is None:
+            return
+        timeout = settings.JOB_QUEUE_DRAIN_TIMEOUT_SECONDS if timeout is None else timeout
+        if self._poller is not None:
+            self._poller.cancel()
+            await asyncio.gather(self._poller, return_exceptions=True)
+        await asyncio.gather(*self._inserts, return_exceptions=True)
+        try:
+            await asyncio.wait_for(self._drain(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Job queue drain timed out with {self.depth} jobs queued; "
+                "they remain spooled for the next start."
+            )
+
+        tasks = [*self._workers, *self._retries]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        await asyncio.to_thread(self._spool.release)
+        await asyncio.to_thread(self._spool.close)
+        self._spool = None
+        logger.info("Job queue stopped.")
+
+    def _room(self) -> int:
+        return self._max_size - self._queue.qsize() - self._reserved
+
+    def _put_nowait(self, job: Job) -> None:
+        self._queue.put_nowait(job)
+        queue_depth.add(1)
+
+    async def _insert(self, name: str, payload: Dict[str, Any], admit: bool) -> int:
+        try:
+            job_id = await asyncio.to_thread(self._spool.add, name, payload, admit)
+        finally:
+            if admit:
+                self._reserved -= 1
+        if admit:
+            self._put_nowait(Job(id=job_id, name=name, payload=payload))
+        else:
+            logger.warning(
+                f"Job queue is full; job '{name}' (id={job_id}) stays spooled until there is room."
+            )
+        return job_id
+
+    async def _claim_spooled(self) -> int:
+        """Queues as many claimable spooled jobs as there is room for."""
+        room = self._room()
+        if room <= 0:
+            return 0
+        self._reserved += room
+        try:
+            jobs = await asyncio.to_thread(self._spool.claim_pending, room)
+        finally:
+            self._reserved -= room
+        for job in jobs:
+            self._put_nowait(job)
+        return len(jobs)
+
+    async def _poll(self) -> None:
+        while True:
+            await asyncio.sleep(self._poll_interval)
+            try:
+                await self._claim_spooled()
+                purged = await asyncio.to_thread(self._spool.purge_dead, self._dead_retention)
+                if purged:
+                    logger.info(f"Purged {purged} dead jobs from the spool.")
+            except Exception:
+                logger.exception("Job spool poll failed.")
+
+    async def _drain(self) -> None:
+        await self._queue.join()
+        while self._retries:
+            await asyncio.gather(*self._retries, return_exceptions=True)
+            await self._queue.join()
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            queue_depth.add(-1)
+            try:
+                await self._run(job)
+            except Exception:
+                logger.exception(f"Job queue bookkeeping failed for job {job.id}.")
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        job.attempts += 1
+        try:
+            handler = self._handlers.get(job.name)
+            if handler is None:
+                raise LookupError(f"No handler registered for job '{job.name}'.")
+            await handler(job.payload)
+        except Exception:
+            dead = job.attempts > self._max_retries
+            await asyncio.to_thread(self._spool.record_failure, job.id, job.attempts, dead)
+            if dead:
+                job_failures.add(1, {"job.name": job.name})
+                logger.exception(
+                    f"Job '{job.name}' (id={job.id}) failed after {job.attempts} attempts; "
+                    "marked as dead in the spool."
+                )
+                return
+
+            delay = self._retry_backoff * 2 ** (job.attempts - 1)
+            logger.warning(
+                f"Job '{job.name}' (id={job.id}) failed on attempt {job.attempts}; "
+                f"retrying in {delay:.2f}s."
+            )
+            task = asyncio.create_task(self._retry_later(job, delay))
+            self._retries.add(task)
+            task.add_done_callback(self._retries.discard)
+            return
+
+        await asyncio.to_thread(self._spool.complete, job.id)
+        job_latency.record((time.monotonic() - job.enqueued_at) * 1000, {"job.name": job.name})
+
+    async def _retry_later(self, job: Job, delay: float) -> None:
+        await asyncio.sleep(delay)
+        if self._room() > 0:
+            self._put_nowait(job)
+        else:
+            # Hand the job back to the spool; the poller queues it once there is room
+            await asyncio.to_thread(self._spool.release, job.id)
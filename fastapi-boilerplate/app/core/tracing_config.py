@@ -1,60 +1,117 @@
-from typing import Sequence
+import functools
+import inspect
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Mapping, Optional
 from loguru import logger
 from opentelemetry import trace
-from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
-from opentelemetry.sdk.trace.export import (
-    BatchSpanProcessor,
-    ConsoleSpanExporter,
-    SpanExporter,
-    SpanExportResult,
-)
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
 from .config import settings
 
+tracer = trace.get_tracer(__name__)
 
-class NullSpanExporter(SpanExporter):
-    """A SpanExporter that does nothing, effectively silencing trace output."""
 
-    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
-        return SpanExportResult.SUCCESS
-
-    def shutdown(self) -> None:
-        pass
-
-    def force_flush(self, timeout_millis: int = 30000) -> bool:
-        return True
-
-def configure_tracing():
+def configure_tracing() -> bool:
     """
     Configures OpenTelemetry for distributed tracing.
 
-    Sets up a TracerProvider and a SpanProcessor with an exporter.
     - If OTEL_EXPORTER_OTLP_ENDPOINT is set, it uses the OTLP exporter.
-    - Otherwise, it defaults to a ConsoleSpanExporter for local development.
+    - If OTEL_DEBUG_LOG_SPANS is set, it uses a ConsoleSpanExporter for local development.
+    - Otherwise, nothing would consume the spans, so no SDK is installed and a
+      no-op TracerProvider is used instead. Spans then cost almost nothing.
+
+    Returns True if spans are being recorded.
     """
+    if not settings.OTEL_EXPORTER_OTLP_ENDPOINT and not settings.OTEL_DEBUG_LOG_SPANS:
+        trace.set_tracer_provider(trace.NoOpTracerProvider())
+        logger.info("OpenTelemetry tracing is disabled. No exporter is configured, so spans are not recorded.")
+        return False
+
+    # The SDK and exporters are imported here rather than at module level, so
+    # processes that don't export spans never load them (or gRPC).
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import (
+        BatchSpanProcessor,
+        ConsoleSpanExporter,
+        SpanExporter,
+    )
+
     resource = Resource(attributes={"service.name": settings.OTEL_SERVICE_NAME})
     provider = TracerProvider(resource=resource)
 
     # Determine which exporter to use based on settings
     exporter: SpanExporter
     if settings.OTEL_EXPORTER_OTLP_ENDPOINT:
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+
         exporter = OTLPSpanExporter(
             endpoint=settings.OTEL_EXPORTER_OTLP_ENDPOINT, insecure=True
         )
         log_message = f"OpenTelemetry configured with OTLP exporter to {settings.OTEL_EXPORTER_OTLP_ENDPOINT}"
-    elif settings.OTEL_DEBUG_LOG_SPANS:
+    else:
         exporter = ConsoleSpanExporter()
         log_message = "OpenTelemetry configured with ConsoleSpanExporter. Traces will be printed to the console."
-    else:
-        exporter = NullSpanExporter()
-        log_message = "OpenTelemetry tracing is active. Spans are not being exported to console."
 
     # Set up the processor and provider, then log the configuration status
     processor = BatchSpanProcessor(exporter)
     provider.add_span_processor(processor)
     trace.set_tracer_provider(provider)
     logger.info(log_message)
+    return True
+
+
+@contextmanager
+def traced_span(
+    name: str,
+    attributes: Optional[Callable[[], Mapping[str, Any]]] = None,
+    span_tracer: Optional[trace.Tracer] = None,
+) -> Iterator[trace.Span]:
+    """
+    Context manager that runs a block inside a new span.
+
+    `attributes` is a callable returning the span attributes. It is only
+    called when the span is recording, so building the values costs nothing
+    when tracing is disabled. For example:
+        `with traced_span("load_user", lambda: {"user.id": user_id}) as span:`
+    """
+    with (span_tracer or tracer).start_as_current_span(name) as span:
+        if attributes is not None and span.is_recording():
+            span.set_attributes(attributes())
+        yield span
+
+
+def traced(
+    name: Optional[str] = None,
+    attributes: Optional[Callable[..., Mapping[str, Any]]] = None,
+    span_tracer: Optional[trace.Tracer] = None,
+):
+    """
+    Decorator that runs a sync or async function inside a new span.
+
+    The span is named `name`, or the function's qualified name by default.
+    `attributes` is called with the function's arguments, and only when the
+    span is recording. Use `trace.get_current_span()` inside the function to
+    add more attributes. For example:
+        `@traced("validate_username", attributes=lambda username: {"username": username})`
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+        func_tracer = span_tracer or trace.get_tracer(func.__module__)
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with func_tracer.start_as_current_span(span_name) as span:
+                    if attributes is not None and span.is_recording():
+                        span.set_attributes(attributes(*args, **kwargs))
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with func_tracer.start_as_current_span(span_name) as span:
+                if attributes is not None and span.is_recording():
+                    span.set_attributes(attributes(*args, **kwargs))
+                return func(*args, **kwargs)
+        return wrapper
 
-    # You can get a tracer instance in other parts of your app like this:
-    # tracer = trace.get_tracer(__name__)
\ No newline at end of file
+    return decorator
@@ -2,26 +2,50 @@ import uvicorn
 from fastapi import FastAPI, Request
 from loguru import logger
 import time
+from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
 
 from . import core
 from . import api
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+from . import services
 
-# Configure logging and tracing before creating the app instance
+# Configure logging, tracing and metrics before creating the app instance
 core.configure_logging()
-core.configure_tracing()
+tracing_enabled = core.configure_tracing()
+core.configure_metrics()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Builds the application-scoped services on startup and releases them on shutdown.
+    """
+    app.state.services = await services.ServiceContainer.create()
+    try:
+        yield
+    finally:
+        await app.state.services.aclose()
+
 
 app = FastAPI(
     title=core.settings.APP_NAME,
     version="1.0.0",
     docs_url="/docs",
     redoc_url=None, # Disable redoc
+    lifespan=lifespan,
 )
 
 # ===============================================
 # Middleware
 # ===============================================
+# Add response compression. It is added before CORS so that CORS wraps it and
+# still runs for the precompressed responses served from its cache.
+if core.settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        core.CompressionMiddleware,
+        cache_paths=[app.openapi_url],
+    )
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -31,21 +55,38 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Instrument FastAPI with OpenTelemetry
-FastAPIInstrumentor.instrument_app(app)
+# Instrument FastAPI with OpenTelemetry. With tracing disabled the request
+# spans would never be recorded, so the instrumentation is skipped entirely.
+if tracing_enabled:
+    from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+
+    FastAPIInstrumentor.instrument_app(app)
 
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """
     FastAPI middleware to log incoming requests.
+
+    With LOG_REPLACE_UVICORN_ACCESS enabled, a single access line is logged
+    per request in place of uvicorn's own access log.
     """
     start_time = time.time()
-    logger.info(f"--> {request.method} {request.url.path}")
+    if not core.settings.LOG_REPLACE_UVICORN_ACCESS:
+        logger.info(f"--> {request.method} {request.url.path}")
     
     response = await call_next(request)
     
     process_time = (time.time() - start_time) * 1000
     formatted_process_time = f"{process_time:.2f}ms"
+
+    if core.settings.LOG_REPLACE_UVICORN_ACCESS:
+        client = f"{request.client.host}:{request.client.port}" if request.client else "-"
+        logger.info(
+            f'{client} - "{request.method} {request.url.path} '
+            f'HTTP/{request.scope.get("http_version", "1.1")}" '
+            f"{response.status_code} {formatted_process_time}"
+        )
+        return response
     
     logger.info(
         f"<-- {request.method} {request.url.path} - "
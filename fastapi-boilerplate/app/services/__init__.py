@@ -3,5 +3,6 @@ This package contains the core business logic of the application, encapsulated i
 """
 from .health_service import HealthService
 from .user_service import UserService
+from .container import ServiceContainer
 
-__all__ = ["HealthService", "UserService"]
+__all__ = ["HealthService", "UserService", "ServiceContainer"]
@@ -0,0 +1,54 @@
+from loguru import logger
+
+from app import core
+from .health_service import HealthService
+from .user_service import UserService, USER_CREATED_JOB
+
+
+class ServiceContainer:
+    """
+    Application-scoped holder for the service instances.
+
+    The container is built once in the app lifespan and shared by every
+    request, so anything a service owns (connection pools, caches, compiled
+    rules) is set up a single time per worker. Pass replacement instances
+    to the constructor to swap a service out in tests.
+    """
+
+    def __init__(
+        self,
+        health_service: HealthService | None = None,
+        user_service: UserService | None = None,
+        jobs: core.JobQueue | None = None,
+        http_client: core.HttpClient | None = None,
+    ):
+        self.jobs = jobs
+        self.http_client = http_client
+        self.health_service = health_service or HealthService()
+        self.user_service = user_service or UserService(jobs=jobs)
+
+    @classmethod
+    async def create(cls) -> "ServiceContainer":
+        """
+        Builds the container and any resources its services depend on.
+        """
+        http_client = core.HttpClient()
+
+        jobs = core.JobQueue()
+        jobs.register(USER_CREATED_JOB, UserService.handle_user_created)
+        await jobs.start()
+
+        container = cls(jobs=jobs, http_client=http_client)
+        logger.info("Service container initialized.")
+        return container
+
+    async def aclose(self) -> None:
+        """
+        Releases resources held by the services. Called on app shutdown.
+        """
+        if self.jobs is not None:
+            await self.jobs.stop()
+        # Closed after the jobs are drained, since jobs may make outbound calls
+        if self.http_client is not None:
+            await self.http_client.aclose()
+        logger.info("Service container closed.")
@@ -1,30 +1,45 @@
 import datetime
 from loguru import logger
-from opentelemetry import trace
 from fastapi import HTTPException, status
 
+from app import core
 from app import schemas
 from app import functions
 from app import utils
 
-tracer = trace.get_tracer(__name__)
-
 # In a real application, this would be your database model.
 # For this example, we'll just use a simple dictionary and a counter.
 fake_user_db = {}
 user_id_counter = 1
 
+# Name of the background job enqueued once a user has been written.
+USER_CREATED_JOB = "user.created"
+
 class UserService:
     """
     Service layer for handling user-related business logic.
     """
 
+    def __init__(self, jobs: core.JobQueue | None = None):
+        self._jobs = jobs
+
+    @staticmethod
+    async def handle_user_created(payload: dict) -> None:
+        """
+        Background job run after a user is created.
+
+        This is where follow-up work such as welcome emails, audit writes and
+        search indexing belongs, so it stays out of the request latency.
+        """
+        logger.info(f"Running post-create tasks for user ID {payload['user_id']}.")
+
     async def create_user(self, user_data: schemas.UserCreate) -> schemas.UserDisplay:
         """
         Creates a new user after validating the username.
         """
-        with tracer.start_as_current_span("user_service_create") as span:
-            span.set_attribute("user.username", user_data.username)
+        with core.traced_span(
+            "user_service_create", lambda: {"user.username": user_data.username}
+        ) as span:
 
             # 1. Delegate validation to a dedicated function
             if not functions.is_valid_username(user_data.username):
@@ -57,6 +72,20 @@ class UserService:
             span.set_attribute("user.id", new_user["id"])
             logger.info(f"User '{new_user['username']}' created successfully with ID {new_user['id']}.")
 
+            # 4. Defer follow-up work until after the write. The user already
+            # exists, so a failure here must not turn the response into an error.
+            if self._jobs is not None:
+                try:
+                    await self._jobs.enqueue(
+                        USER_CREATED_JOB,
+                        {"user_id": new_user["id"], "username": new_user["username"]},
+                    )
+                except Exception:
+                    logger.exception(
+                        f"Failed to enqueue '{USER_CREATED_JOB}' for user ID {new_user['id']}; "
+                        "post-create tasks will not run."
+                    )
+
             return schemas.UserDisplay(
                 id=new_user["id"],
                 username=new_user["username"],
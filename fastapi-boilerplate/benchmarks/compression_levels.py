@@ -0,0 +1,91 @@
+"""
+Benchmark of the CPU-versus-bandwidth trade-off of each response encoding.
+
+For every installed encoding and a range of levels, compresses two payloads
+(a large user listing and the app's OpenAPI document) and reports the
+compression time, the output size, and the break-even bandwidth: the link
+speed below which compressing is faster end to end than sending raw bytes.
+
+Run from the `fastapi-boilerplate` directory:
+    uv pip install -e .[compression]
+    python -m benchmarks.compression_levels
+"""
+import argparse
+import datetime
+import json
+import time
+
+from app.core import compression
+
+LEVELS = {
+    "gzip": (1, 6, 9),
+    "br": (1, 4, 6, 11),
+    "zstd": (1, 3, 9, 19),
+}
+
+
+def user_listing(count: int) -> bytes:
+    now = datetime.datetime(2024, 1, 1)
+    users = [
+        {
+            "id": i,
+            "username": f"user_{i:06d}",
+            "created_at": (now + datetime.timedelta(seconds=i)).isoformat(),
+        }
+        for i in range(count)
+    ]
+    return json.dumps(users).encode()
+
+
+def openapi_document() -> bytes:
+    from app.main import app
+    return json.dumps(app.openapi()).encode()
+
+
+def encoder_for(name: str, level: int):
+    if name == "gzip":
+        return compression.GzipEncoder(level)
+    if name == "br" and compression.brotli is not None:
+        return compression.BrotliEncoder(level)
+    if name == "zstd" and compression.zstandard is not None:
+        return compression.ZstdEncoder(level)
+    return None
+
+
+def measure(encoder, payload: bytes, iterations: int) -> tuple[float, int]:
+    """Returns (milliseconds per compression, compressed size)."""
+    compressed = encoder.compress(payload)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        encoder.compress(payload)
+    return (time.perf_counter() - start) / iterations * 1000, len(compressed)
+
+
+def main(users: int, iterations: int) -> None:
+    payloads = {
+        f"users[{users}]": user_listing(users),
+        "openapi.json": openapi_document(),
+    }
+    for label, payload in payloads.items():
+        print(f"\n{label}: {len(payload):,} bytes")
+        print(f"{'encoding':<10}{'level':>6}{'ms':>10}{'bytes':>12}{'ratio':>8}{'break-even Mbit/s':>20}")
+        for name, levels in LEVELS.items():
+            for level in levels:
+                encoder = encoder_for(name, level)
+                if encoder is None:
+                    continue
+                ms, size = measure(encoder, payload, iterations)
+                saved_bits = (len(payload) - size) * 8
+                break_even = saved_bits / (ms / 1000) / 1_000_000 if ms else float("inf")
+                print(
+                    f"{name:<10}{level:>6}{ms:>10.3f}{size:>12,}"
+                    f"{len(payload) / size:>8.2f}{break_even:>20.1f}"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+    main(args.users, args.iterations)
@@ -0,0 +1,77 @@
+"""
+Benchmark of the per-request cost of injecting a service into a route.
+
+Compares three otherwise identical routes:
+- `baseline`: no dependency at all.
+- `per_request`: the previous `Depends()` style, which builds a new service
+  object and resolves its constructor signature on every request.
+- `container`: the application-scoped provider from `app.api.dependencies`.
+
+Run from the `fastapi-boilerplate` directory:
+    python -m benchmarks.di_overhead
+"""
+import argparse
+import asyncio
+import time
+
+import httpx
+from fastapi import Depends, FastAPI
+
+from app.api.dependencies import get_user_service
+from app import services
+
+
+class PerRequestService:
+    """Stand-in for a service that is constructed on every request."""
+
+    def __init__(self):
+        self.cache = {}
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+    # The benchmark does not run the lifespan, so wire the container directly.
+    app.state.services = services.ServiceContainer()
+
+    @app.get("/baseline")
+    async def baseline() -> dict:
+        return {"ok": True}
+
+    @app.get("/per_request")
+    async def per_request(service: PerRequestService = Depends()) -> dict:
+        return {"ok": True}
+
+    @app.get("/container")
+    async def container(service: services.UserService = Depends(get_user_service)) -> dict:
+        return {"ok": True}
+
+    return app
+
+
+async def measure(client: httpx.AsyncClient, path: str, iterations: int) -> float:
+    """Returns the mean time per request in microseconds."""
+    for _ in range(min(iterations, 200)):
+        await client.get(path)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await client.get(path)
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+async def main(iterations: int) -> None:
+    transport = httpx.ASGITransport(app=build_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        results = {path: await measure(client, path, iterations) for path in ("/baseline", "/per_request", "/container")}
+
+    baseline = results["/baseline"]
+    print(f"{'route':<14}{'us/request':>12}{'DI overhead (us)':>20}")
+    for path, mean in results.items():
+        print(f"{path.lstrip('/'):<14}{mean:>12.1f}{mean - baseline:>20.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
@@ -0,0 +1,101 @@
+"""
+Benchmark of a pooled HTTP client versus a new client per call.
+
+Starts a local keep-alive HTTP/1.1 stub server, then sends the same number
+of GET requests (sequentially and with concurrency) using:
+- `pooled`: one shared `app.core.HttpClient` for all calls.
+- `per-call`: a fresh `httpx.AsyncClient` for every call, as happens when
+  each caller builds its own client.
+
+The stub server counts accepted connections, which shows how many
+handshakes each style paid for.
+
+Run from the `fastapi-boilerplate` directory:
+    python -m benchmarks.http_client_pooling
+"""
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from app.core import HttpClient
+
+RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: 11\r\n\r\n{\"ok\":true}"
+
+
+class StubServer:
+    """Minimal keep-alive HTTP/1.1 server that answers every request with 200."""
+
+    def __init__(self):
+        self.connections = 0
+        self._server = None
+
+    async def start(self) -> int:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while True:
+                await reader.readuntil(b"\r\n\r\n")
+                writer.write(RESPONSE)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def run(call, requests: int, concurrency: int) -> float:
+    """Returns the mean latency per request in milliseconds."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            response = await call()
+            assert response.status_code == 200
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return (time.perf_counter() - start) / requests * 1000
+
+
+async def main(requests: int) -> None:
+    server = StubServer()
+    port = await server.start()
+    url = f"http://127.0.0.1:{port}/resource"
+
+    pooled_client = HttpClient()
+
+    async def pooled():
+        return await pooled_client.get(url)
+
+    async def per_call():
+        async with httpx.AsyncClient() as client:
+            return await client.get(url)
+
+    print(f"{'client':<10}{'concurrency':>12}{'ms/request':>12}{'req/s':>10}{'connections':>13}")
+    for concurrency in (1, 10):
+        for label, call in (("pooled", pooled), ("per-call", per_call)):
+            connections_before = server.connections
+            ms = await run(call, requests, concurrency)
+            print(
+                f"{label:<10}{concurrency:>12}{ms:>12.3f}{1000 / ms:>10.0f}"
+                f"{server.connections - connections_before:>13}"
+            )
+
+    await pooled_client.aclose()
+    await server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
@@ -0,0 +1,86 @@
+"""
+Benchmark of time-to-first-200 on `/api/health` for a fresh worker.
+
+Each run starts a new uvicorn process and polls `/api/health` until it
+answers 200. Modes:
+- `cold-bytecode`: an empty bytecode cache, so every module (the app and
+  its dependencies) is compiled from source, as in an image built without
+  precompiled bytecode.
+- `warm-bytecode`: existing .pyc files are used, as in an image built with
+  `--compile-bytecode`.
+- `warm-bytecode+otlp`: as above, with an OTLP endpoint configured, so the
+  SDK and gRPC exporter are imported at startup.
+
+Run from the `fastapi-boilerplate` directory:
+    python -m benchmarks.startup_time
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_to_first_200(env: dict, timeout: float = 60.0) -> float:
+    """Starts a worker and returns the seconds until /api/health returns 200."""
+    port = free_port()
+    url = f"http://127.0.0.1:{port}/api/health"
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except (urllib.error.URLError, ConnectionError):
+                pass
+            if process.poll() is not None:
+                raise RuntimeError(f"Worker exited with code {process.returncode} before becoming ready.")
+            time.sleep(0.005)
+        raise TimeoutError(f"{url} did not return 200 within {timeout}s.")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main(runs: int) -> None:
+    base_env = {**os.environ, "OTEL_DEBUG_LOG_SPANS": "false", "JOB_QUEUE_SPOOL_PATH": os.path.join(tempfile.gettempdir(), "startup_bench_spool.sqlite3")}
+    base_env.pop("OTEL_EXPORTER_OTLP_ENDPOINT", None)
+    base_env.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    # Prime the regular bytecode cache so the warm modes measure reads only.
+    time_to_first_200(base_env)
+
+    modes = {
+        "cold-bytecode": lambda: {**base_env, "PYTHONPYCACHEPREFIX": tempfile.mkdtemp(prefix="pycache-")},
+        "warm-bytecode": lambda: base_env,
+        "warm-bytecode+otlp": lambda: {**base_env, "OTEL_EXPORTER_OTLP_ENDPOINT": "http://127.0.0.1:4317"},
+    }
+    print(f"{'mode':<22}{'median (s)':>12}{'min (s)':>10}{'max (s)':>10}")
+    for mode, make_env in modes.items():
+        samples = [time_to_first_200(make_env()) for _ in range(runs)]
+        print(f"{mode:<22}{statistics.median(samples):>12.3f}{min(samples):>10.3f}{max(samples):>10.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    main(args.runs)
@@ -0,0 +1,121 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import (
+    BrotliEncoder,
+    CompressionMiddleware,
+    GzipEncoder,
+    parse_accept_encoding,
+)
+
+LARGE_TEXT = "hello compression " * 200
+SMALL_TEXT = "hello"
+
+
+@pytest.fixture
+def client():
+    """A client for an app wrapped like main.py: CORS outside CompressionMiddleware."""
+    app = FastAPI()
+    app.state.cached_calls = 0
+
+    @app.get("/text")
+    def text(size: str = "large"):
+        return PlainTextResponse(LARGE_TEXT if size == "large" else SMALL_TEXT)
+
+    @app.get("/image")
+    def image():
+        return Response(LARGE_TEXT.encode(), media_type="image/png")
+
+    @app.get("/events")
+    def events():
+        return StreamingResponse(iter([LARGE_TEXT, LARGE_TEXT]), media_type="text/event-stream")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([SMALL_TEXT, LARGE_TEXT]), media_type="text/plain")
+
+    @app.get("/cached")
+    def cached():
+        app.state.cached_calls += 1
+        return PlainTextResponse(LARGE_TEXT)
+
+    app.add_middleware(CompressionMiddleware, minimum_size=1024, cache_paths=["/cached"])
+    app.add_middleware(CORSMiddleware, allow_origins=["http://frontend"])
+    return TestClient(app, headers={"Accept-Encoding": "gzip"})
+
+
+def test_body_under_minimum_size_is_not_compressed(client):
+    """Tests that only bodies of at least minimum_size bytes are compressed."""
+    small = client.get("/text", params={"size": "small"})
+    large = client.get("/text")
+
+    assert "content-encoding" not in small.headers
+    assert large.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in large.headers["vary"]
+    assert int(large.headers["content-length"]) < len(LARGE_TEXT)
+    assert large.text == LARGE_TEXT
+
+
+@pytest.mark.parametrize("path", ["/image", "/events"])
+def test_media_types_outside_allowlist_or_excluded_are_not_compressed(client, path):
+    """Tests that image/png (not allowed) and text/event-stream (excluded) pass through."""
+    response = client.get(path)
+
+    assert "content-encoding" not in response.headers
+    assert LARGE_TEXT in response.text
+
+
+def test_streaming_response_is_compressed_chunk_by_chunk(client):
+    """Tests that a streamed body is compressed even if its first chunk is small."""
+    response = client.get("/stream")
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert response.text == SMALL_TEXT + LARGE_TEXT
+
+
+def test_cached_path_is_served_from_memory_with_cors_headers(client):
+    """Tests that a cache hit skips the app and still gets the per-request CORS headers."""
+    first = client.get("/cached", headers={"Origin": "http://frontend"})
+    second = client.get("/cached", headers={"Origin": "http://frontend"})
+    other_origin = client.get("/cached", headers={"Origin": "http://elsewhere"})
+
+    assert client.app.state.cached_calls == 1
+    for response in (first, second):
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["access-control-allow-origin"] == "http://frontend"
+        assert response.headers["vary"] == "Accept-Encoding, Origin"
+        assert response.text == LARGE_TEXT
+    assert "access-control-allow-origin" not in other_origin.headers
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("gzip, br", "br"),
+        ("br;q=0.5, gzip", "gzip"),
+        ("br;level=1;q=0.9, gzip", "gzip"),
+        ("gzip;q=0", None),
+        ("br;q=0, gzip;q=0", None),
+        ("*", "br"),
+        ("*;q=0.5, br;q=0", "gzip"),
+        ("identity", None),
+        ("", None),
+    ],
+)
+def test_negotiation_honours_q_values_and_wildcard(accept_encoding, expected):
+    """Tests that the highest q-value wins, q=0 refuses a coding, and * covers unlisted ones."""
+    middleware = CompressionMiddleware(app=None)
+    middleware.encoders = [BrotliEncoder(4), GzipEncoder(6)]
+
+    encoder = middleware.negotiate(accept_encoding)
+
+    assert (encoder.name if encoder else None) == expected
+
+
+def test_q_value_is_found_after_other_parameters():
+    """Tests that q is read wherever it appears among the parameters."""
+    assert parse_accept_encoding("br;level=1;q=0.9, gzip") == {"br": 0.9, "gzip": 1.0}
@@ -0,0 +1,65 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app import schemas
+from app.api.dependencies import get_user_service
+from app.core.config import settings
+from app.main import app
+from app.services import user_service
+from app.services.user_service import UserService
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    """A client whose context runs the app lifespan, with the job spool in a temp directory."""
+    monkeypatch.setattr(settings, "JOB_QUEUE_SPOOL_PATH", str(tmp_path / "spool.sqlite3"))
+    monkeypatch.setattr(user_service, "fake_user_db", {})
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+def test_lifespan_builds_services_once_and_closes_them(client, monkeypatch):
+    """Tests that every request is served by the same service instances built in the lifespan."""
+    seen = []
+    create_user = UserService.create_user
+
+    async def spy(self, user_data):
+        seen.append(self)
+        return await create_user(self, user_data)
+
+    monkeypatch.setattr(UserService, "create_user", spy)
+    container = client.app.state.services
+
+    assert client.post("/api/users", json={"username": "alice"}).status_code == 201
+    assert client.post("/api/users", json={"username": "bobby"}).status_code == 201
+    assert client.get("/api/health").json()["status"] == "ok"
+
+    assert seen == [container.user_service, container.user_service]
+    assert client.app.state.services is container
+
+
+def test_lifespan_shuts_down_the_job_queue(monkeypatch, tmp_path):
+    """Tests that leaving the client context runs the lifespan shutdown."""
+    monkeypatch.setattr(settings, "JOB_QUEUE_SPOOL_PATH", str(tmp_path / "spool.sqlite3"))
+    with TestClient(app):
+        jobs = app.state.services.jobs
+        assert jobs._spool is not None
+
+    assert jobs._spool is None
+
+
+def test_user_service_can_be_overridden(client):
+    """Tests that a route uses a fake service installed through dependency_overrides."""
+
+    class FakeUserService:
+        async def create_user(self, user_data):
+            return schemas.UserDisplay(id=99, username=user_data.username, created_at="fake")
+
+    app.dependency_overrides[get_user_service] = lambda: FakeUserService()
+
+    response = client.post("/api/users", json={"username": "alice"})
+
+    assert response.status_code == 201
+    assert response.json() == {"id": 99, "username": "alice", "created_at": "fake"}
+    assert "alice" not in user_service.fake_user_db
@@ -0,0 +1,168 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.config import settings
+from app.core.http_client import CircuitBreaker, CircuitOpenError, HttpClient
+
+
+def make_client(responder, **kwargs) -> HttpClient:
+    """Builds an HttpClient whose requests are answered by `responder` instead of the network."""
+    transport = httpx.MockTransport(responder)
+    return HttpClient(client=httpx.AsyncClient(transport=transport), retry_backoff=0, **kwargs)
+
+
+def test_retries_idempotent_request_on_retryable_status():
+    """Tests that a GET is retried after a 503 and returns the later success."""
+    calls = []
+
+    def responder(request):
+        calls.append(request)
+        return httpx.Response(503 if len(calls) == 1 else 200)
+
+    response = asyncio.run(make_client(responder).get("http://downstream/resource"))
+
+    assert response.status_code == 200
+    assert len(calls) == 2
+
+
+def test_does_not_retry_non_idempotent_request():
+    """Tests that a POST is sent only once, even on a retryable status."""
+    calls = []
+
+    def responder(request):
+        calls.append(request)
+        return httpx.Response(503)
+
+    response = asyncio.run(make_client(responder).post("http://downstream/resource", json={"a": 1}))
+
+    assert response.status_code == 503
+    assert len(calls) == 1
+
+
+def test_raises_transport_error_after_retries():
+    """Tests that a connection error is retried and re-raised once retries are used up."""
+    calls = []
+
+    def responder(request):
+        calls.append(request)
+        raise httpx.ConnectError("connection refused", request=request)
+
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(make_client(responder, max_retries=2).get("http://downstream/resource"))
+
+    assert len(calls) == 3
+
+
+def test_circuit_counts_one_failure_per_call(monkeypatch):
+    """Tests that retries within a call count as a single failure and surface the real error."""
+    monkeypatch.setattr(settings, "HTTP_CLIENT_CIRCUIT_FAILURE_THRESHOLD", 2)
+    calls = []
+
+    def responder(request):
+        calls.append(request)
+        raise httpx.ConnectError("connection refused", request=request)
+
+    async def scenario():
+        client = make_client(responder, max_retries=2)
+        for _ in range(2):
+            with pytest.raises(httpx.ConnectError):
+                await client.get("http://flaky/resource")
+        with pytest.raises(CircuitOpenError):
+            await client.get("http://flaky/resource")
+
+    asyncio.run(scenario())
+
+    assert len(calls) == 6
+
+
+def test_circuit_opens_per_host(monkeypatch):
+    """Tests that the circuit opens per host and rejects calls without sending them."""
+    monkeypatch.setattr(settings, "HTTP_CLIENT_CIRCUIT_FAILURE_THRESHOLD", 2)
+    calls = []
+
+    def responder(request):
+        calls.append(request)
+        return httpx.Response(503 if request.url.host == "flaky" else 200)
+
+    async def scenario():
+        client = make_client(responder, max_retries=0)
+        await client.get("http://flaky/resource")
+        await client.get("http://flaky/resource")
+        with pytest.raises(CircuitOpenError):
+            await client.get("http://flaky/resource")
+        assert (await client.get("http://healthy/resource")).status_code == 200
+
+    asyncio.run(scenario())
+
+    assert len(calls) == 3
+
+
+def test_half_open_circuit_lets_a_single_probe_through(monkeypatch):
+    """Tests that concurrent calls after the reset timeout send one probe and reject the rest."""
+    monkeypatch.setattr(settings, "HTTP_CLIENT_CIRCUIT_FAILURE_THRESHOLD", 1)
+    monkeypatch.setattr(settings, "HTTP_CLIENT_CIRCUIT_RESET_SECONDS", 0.05)
+    calls = []
+
+    async def responder(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(503)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200)
+
+    async def scenario():
+        client = make_client(responder, max_retries=0)
+        await client.get("http://recovering/resource")
+        await asyncio.sleep(0.06)
+
+        results = await asyncio.gather(
+            *(client.get("http://recovering/resource") for _ in range(5)),
+            return_exceptions=True,
+        )
+        assert [getattr(result, "status_code", None) for result in results].count(200) == 1
+        assert sum(isinstance(result, CircuitOpenError) for result in results) == 4
+
+        # The successful probe closed the circuit
+        assert (await client.get("http://recovering/resource")).status_code == 200
+
+    asyncio.run(scenario())
+
+    assert len(calls) == 3
+
+
+def test_failed_probe_reopens_circuit():
+    """Tests that a failure while half-open re-opens the circuit for another reset timeout."""
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=0)
+    for _ in range(3):
+        breaker.record_failure()
+    assert breaker.state == "open"
+
+    assert breaker.allow_request()
+    assert breaker.state == "half_open"
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    breaker.reset_timeout = 60
+    assert not breaker.allow_request()
+
+
+def test_injects_trace_context_into_request_headers():
+    """Tests that a traceparent header is sent when a span is active."""
+    from opentelemetry.sdk.trace import TracerProvider
+
+    seen = []
+
+    def responder(request):
+        seen.append(request.headers.get("traceparent"))
+        return httpx.Response(200)
+
+    async def scenario():
+        tracer = TracerProvider().get_tracer(__name__)
+        with tracer.start_as_current_span("parent"):
+            await make_client(responder).get("http://downstream/resource")
+
+    asyncio.run(scenario())
+
+    assert seen[0] is not None and seen[0].startswith("00-")
@@ -0,0 +1,238 @@
+import asyncio
+import subprocess
+import sys
+import time
+
+from opentelemetry import metrics
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from app.core.task_queue import JobQueue, JobSpool
+
+JOB = "test.job"
+
+
+def make_queue(tmp_path, handler, **kwargs) -> JobQueue:
+    """Builds a JobQueue with a temporary spool, no retry delay and a fast poller."""
+    options = {"concurrency": 1, "retry_backoff": 0, "poll_interval": 0.01, **kwargs}
+    queue = JobQueue(spool_path=str(tmp_path / "spool.sqlite3"), **options)
+    queue.register(JOB, handler)
+    return queue
+
+
+def spooled_rows(tmp_path) -> list:
+    spool = JobSpool(str(tmp_path / "spool.sqlite3"))
+    try:
+        return spool._conn.execute("SELECT id, attempts, owner, dead FROM jobs").fetchall()
+    finally:
+        spool.close()
+
+
+async def wait_until(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met before timeout"
+        await asyncio.sleep(0.005)
+
+
+def test_failed_job_is_retried_with_exponential_backoff(tmp_path):
+    """Tests that a failing job is retried after doubling delays and removed once it succeeds."""
+    attempts = []
+
+    async def handler(payload):
+        attempts.append(time.monotonic())
+        if len(attempts) < 3:
+            raise RuntimeError("downstream unavailable")
+
+    async def scenario():
+        queue = make_queue(tmp_path, handler, max_retries=3, retry_backoff=0.05)
+        await queue.start()
+        await queue.enqueue(JOB, {"n": 1})
+        await wait_until(lambda: len(attempts) == 3)
+        await queue.stop()
+
+    asyncio.run(scenario())
+
+    assert attempts[1] - attempts[0] >= 0.05
+    assert attempts[2] - attempts[1] >= 0.1
+    assert spooled_rows(tmp_path) == []
+
+
+def test_job_is_marked_dead_after_exhausting_retries(tmp_path):
+    """Tests that a job failing past max_retries is kept as dead, listed, and can be requeued."""
+    calls = []
+
+    async def handler(payload):
+        calls.append(payload)
+        if len(calls) <= 2:
+            raise RuntimeError("always fails")
+
+    async def scenario():
+        queue = make_queue(tmp_path, handler, max_retries=1)
+        await queue.start()
+        job_id = await queue.enqueue(JOB, {"n": 1})
+        await wait_until(lambda: len(calls) == 2)
+        await asyncio.sleep(0.05)
+        dead = await queue.dead_jobs()
+
+        assert [(job.id, job.attempts) for job in dead] == [(job_id, 2)]
+        assert await queue.requeue_dead([job_id]) == 1
+        await wait_until(lambda: len(calls) == 3)
+        await queue.stop()
+
+    asyncio.run(scenario())
+
+    assert spooled_rows(tmp_path) == []
+
+
+def test_dead_jobs_are_purged_after_retention(tmp_path):
+    """Tests that only dead rows older than the retention are deleted."""
+    spool = JobSpool(str(tmp_path / "spool.sqlite3"))
+    dead_id = spool.add(JOB, {})
+    live_id = spool.add(JOB, {})
+    spool.record_failure(dead_id, attempts=4, dead=True)
+
+    assert spool.purge_dead(older_than=60) == 0
+    assert spool.purge_dead(older_than=0) == 1
+    assert [row[0] for row in spool._conn.execute("SELECT id FROM jobs")] == [live_id]
+    spool.close()
+
+
+def test_enqueue_does_not_block_when_queue_is_full(tmp_path):
+    """Tests that overflow jobs stay spooled without blocking the caller and run once there is room."""
+    done = []
+
+    async def scenario():
+        gate = asyncio.Event()
+
+        async def handler(payload):
+            await gate.wait()
+            done.append(payload["n"])
+
+        queue = make_queue(tmp_path, handler, max_size=1)
+        await queue.start()
+        for n in range(4):
+            await asyncio.wait_for(queue.enqueue(JOB, {"n": n}), timeout=0.5)
+        assert queue.depth <= 1
+
+        gate.set()
+        await wait_until(lambda: len(done) == 4)
+        await queue.stop()
+
+    asyncio.run(scenario())
+
+    assert sorted(done) == [0, 1, 2, 3]
+    assert spooled_rows(tmp_path) == []
+
+
+def test_cancelled_enqueue_still_runs_job(tmp_path):
+    """Tests that cancelling the caller mid-enqueue does not strand the spooled row."""
+    done = []
+
+    async def handler(payload):
+        done.append(payload["n"])
+
+    async def scenario():
+        queue = make_queue(tmp_path, handler)
+        await queue.start()
+        caller = asyncio.create_task(queue.enqueue(JOB, {"n": 1}))
+        await asyncio.sleep(0)
+        caller.cancel()
+        await asyncio.gather(caller, return_exceptions=True)
+        await wait_until(lambda: done == [1])
+        await queue.stop()
+
+    asyncio.run(scenario())
+
+    assert spooled_rows(tmp_path) == []
+
+
+def test_drain_timeout_leaves_jobs_spooled_for_next_start(tmp_path):
+    """Tests that jobs unfinished at the drain timeout are released and run by the next queue."""
+    done = []
+
+    async def slow_handler(payload):
+        await asyncio.sleep(10)
+
+    async def handler(payload):
+        done.append(payload["n"])
+
+    async def first_run():
+        queue = make_queue(tmp_path, slow_handler)
+        await queue.start()
+        await queue.enqueue(JOB, {"n": 1})
+        await queue.enqueue(JOB, {"n": 2})
+        started = time.monotonic()
+        await queue.stop(timeout=0.05)
+        assert time.monotonic() - started < 1
+
+    async def second_run():
+        queue = make_queue(tmp_path, handler)
+        await queue.start()
+        await wait_until(lambda: len(done) == 2)
+        await queue.stop()
+
+    asyncio.run(first_run())
+    assert [(row[2], row[3]) for row in spooled_rows(tmp_path)] == [(None, 0), (None, 0)]
+
+    asyncio.run(second_run())
+    assert sorted(done) == [1, 2]
+
+
+def test_jobs_owned_by_exited_process_are_reclaimed(tmp_path):
+    """Tests that rows left by a process that no longer exists are picked up on start."""
+    exited = subprocess.Popen([sys.executable, "-c", "pass"])
+    exited.wait()
+
+    spool = JobSpool(str(tmp_path / "spool.sqlite3"))
+    spool._owner = exited.pid
+    spool.add(JOB, {"n": 1})
+    spool.close()
+    done = []
+
+    async def handler(payload):
+        done.append(payload["n"])
+
+    async def scenario():
+        queue = make_queue(tmp_path, handler)
+        await queue.start()
+        await wait_until(lambda: done == [1])
+        await queue.stop()
+
+    asyncio.run(scenario())
+
+    assert spooled_rows(tmp_path) == []
+
+
+def test_queue_metrics_reach_the_installed_meter_provider(tmp_path):
+    """Tests that depth, latency and failures are recorded once a MeterProvider is installed."""
+    reader = InMemoryMetricReader()
+    metrics.set_meter_provider(MeterProvider(metric_readers=[reader]))
+    done = []
+
+    async def handler(payload):
+        if payload["fail"]:
+            raise RuntimeError("always fails")
+        done.append(payload)
+
+    async def scenario():
+        queue = make_queue(tmp_path, handler, max_retries=0)
+        await queue.start()
+        await queue.enqueue(JOB, {"fail": False})
+        await queue.enqueue(JOB, {"fail": True})
+        await wait_until(lambda: len(done) == 1)
+        await queue.stop()
+
+    asyncio.run(scenario())
+
+    recorded = {
+        metric.name: metric.data.data_points
+        for resource_metrics in reader.get_metrics_data().resource_metrics
+        for scope_metrics in resource_metrics.scope_metrics
+        for metric in scope_metrics.metrics
+    }
+    assert [point.value for point in recorded["jobs.queue.depth"]] == [0]
+    assert [point.count for point in recorded["jobs.latency"]] == [1]
+    assert [(point.attributes, point.value) for point in recorded["jobs.failed"]] == [
+        ({"job.name": JOB}, 1)
+    ]
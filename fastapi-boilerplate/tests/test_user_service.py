@@ -0,0 +1,23 @@
+import asyncio
+
+from app import schemas
+from app.services import user_service
+from app.services.user_service import UserService
+
+
+class FailingJobQueue:
+    """Stands in for a JobQueue whose spool insert fails, e.g. on a full disk."""
+
+    async def enqueue(self, name, payload=None):
+        raise OSError("disk full")
+
+
+def test_create_user_succeeds_when_enqueue_fails(monkeypatch):
+    """Tests that a failed enqueue after the write still returns the created user."""
+    monkeypatch.setattr(user_service, "fake_user_db", {})
+    service = UserService(jobs=FailingJobQueue())
+
+    user = asyncio.run(service.create_user(schemas.UserCreate(username="alice")))
+
+    assert user.username == "alice"
+    assert "alice" in user_service.fake_user_db
@@ -0,0 +1,53 @@
+"""
+Benchmark of the latency and size of Lambda responses, with and without gzip.
+
+For a range of JSON body sizes, times `build_http_response` for a client
+that does not accept gzip and one that does, and reports the body size that
+API Gateway would receive in each case.
+
+Run from the `lambda_boilerplate` directory:
+    python -m benchmarks.response_size
+"""
+import argparse
+import json
+import time
+
+from src.utils.response_builder import LAMBDA_MAX_RESPONSE_BYTES, build_http_response
+
+PLAIN_EVENT = {"headers": {}}
+GZIP_EVENT = {"headers": {"Accept-Encoding": "gzip"}}
+
+
+def json_body(target_bytes: int) -> str:
+    record = {"id": 0, "username": "user_000000", "created_at": "2024-01-01T00:00:00"}
+    count = max(1, target_bytes // (len(json.dumps(record)) + 2))
+    return json.dumps([{**record, "id": i, "username": f"user_{i:06d}"} for i in range(count)])
+
+
+def measure(body: str, event: dict, iterations: int) -> tuple[float, int]:
+    """Returns (milliseconds per response, response body size)."""
+    response = build_http_response(body, event)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        build_http_response(body, event)
+    return (time.perf_counter() - start) / iterations * 1000, len(response["body"])
+
+
+def main(iterations: int) -> None:
+    sizes = [512, 10 * 1024, 100 * 1024, 1024 * 1024, 5 * 1024 * 1024]
+    print(f"{'body':>10}{'plain ms':>10}{'plain bytes':>14}{'gzip ms':>10}{'gzip bytes':>14}{'% of limit':>12}")
+    for size in sizes:
+        body = json_body(size)
+        plain_ms, plain_size = measure(body, PLAIN_EVENT, iterations)
+        gzip_ms, gzip_size = measure(body, GZIP_EVENT, iterations)
+        print(
+            f"{len(body):>10,}{plain_ms:>10.3f}{plain_size:>14,}"
+            f"{gzip_ms:>10.3f}{gzip_size:>14,}{gzip_size / LAMBDA_MAX_RESPONSE_BYTES:>12.1%}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=10)
+    args = parser.parse_args()
+    main(args.iterations)
@@ -12,13 +12,15 @@ if __name__ == "__main__":
     sys.path.insert(0, project_root)
     # Now we can use absolute imports from 'src'
     from src.core.logging_config import configure_logging
-    from src.core.tracing_config import configure_tracing
+    from src.core.tracing_config import configure_tracing, traced_span
     from src import services
+    from src import utils
 else:
     # Use relative imports when running as part of a package (e.g., in Lambda)
     from .core.logging_config import configure_logging
-    from .core.tracing_config import configure_tracing
+    from .core.tracing_config import configure_tracing, traced_span
     from . import services
+    from . import utils
 
 # Configure logging and tracing at the module level
 configure_logging()
@@ -28,27 +30,25 @@ configure_tracing()
 hello_service = services.HelloService()
 tracer = trace.get_tracer(__name__)
 
+def _handler_span_attributes(context) -> dict:
+    if hasattr(context, 'aws_request_id'):
+        return {"aws.request_id": context.aws_request_id}
+    return {}
+
 def handler(event, context):
     """
     Main Lambda handler.
     """
-    with tracer.start_as_current_span("lambda_handler") as span:
+    with traced_span("lambda_handler", lambda: _handler_span_attributes(context), tracer) as span:
         with logger.contextualize(lambda_context=context):
             try:
-                if hasattr(context, 'aws_request_id'):
-                    span.set_attribute("aws.request_id", context.aws_request_id)
-                
                 logger.info(f"Received event: {json.dumps(event)}")
                 
                 response_data = hello_service.get_hello_message(event)
 
                 logger.info("Lambda execution finished successfully.")
                 
-                return {
-                    "statusCode": 200,
-                    "headers": {"Content-Type": "application/json"},
-                    "body": response_data.model_dump_json(),
-                }
+                return utils.build_http_response(response_data.model_dump_json(), event)
             except Exception as e:
                 logger.exception("An error occurred during Lambda execution.")
                 span.record_exception(e)
@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from enum import Enum
-from typing import Optional
+from typing import Dict, Optional
 
 class LogLevel(str, Enum):
     DEBUG = "DEBUG"
@@ -18,12 +18,34 @@ class Settings(BaseSettings):
     # Logging configuration
     LOG_LEVEL: LogLevel = LogLevel.INFO
     LOGURU_JSON_LOGS: bool = False
+    # Walk stack frames to find the caller of each stdlib log record
+    LOG_INTERCEPT_RESOLVE_CALLER: bool = True
+    # Per-logger levels applied in stdlib logging, e.g. {"botocore": "WARNING"}
+    LOG_LEVEL_OVERRIDES: Dict[str, LogLevel] = {}
 
     # OpenTelemetry configuration
     OTEL_SERVICE_NAME: str = "lambda-boilerplate"
     OTEL_EXPORTER_OTLP_ENDPOINT: Optional[str] = None
     OTEL_DEBUG_LOG_SPANS: bool = False
 
+    # Outbound HTTP client configuration
+    HTTP_CLIENT_HTTP2: bool = False
+    HTTP_CLIENT_TIMEOUT_SECONDS: float = 5.0
+    HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS: float = 2.0
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 20
+    HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS: float = 60.0
+    HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST: int = 10
+    HTTP_CLIENT_MAX_RETRIES: int = 2
+    HTTP_CLIENT_RETRY_BACKOFF_SECONDS: float = 0.1
+    HTTP_CLIENT_RETRY_BACKOFF_MAX_SECONDS: float = 1.0
+    HTTP_CLIENT_CIRCUIT_FAILURE_THRESHOLD: int = 5
+    HTTP_CLIENT_CIRCUIT_RESET_SECONDS: float = 30.0
+
+    # Response configuration
+    RESPONSE_COMPRESSION_MIN_SIZE: int = 1024
+    RESPONSE_GZIP_LEVEL: int = 6
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding='utf-8',
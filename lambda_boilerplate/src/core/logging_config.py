@@ -1,16 +1,47 @@
 import sys
 import logging
+from contextvars import ContextVar
+from typing import Dict, Optional, Union
 from loguru import logger
 from .config import settings
 from opentelemetry import trace
 
+# Stdlib record being forwarded by InterceptHandler with `resolve_caller`
+# disabled, read by the `_use_stdlib_origin` patcher.
+_stdlib_record: ContextVar[Optional[logging.LogRecord]] = ContextVar("_stdlib_record", default=None)
+
 class InterceptHandler(logging.Handler):
-    """Intercepts standard logging messages and redirects them to Loguru."""
+    """
+    Intercepts standard logging messages and redirects them to Loguru.
+    Level lookups are cached; with `resolve_caller` disabled, the frame walk
+    is skipped and the origin is taken from the stdlib record instead.
+    """
+    def __init__(self, resolve_caller: bool = True, level: int = logging.NOTSET):
+        super().__init__(level)
+        self.resolve_caller = resolve_caller
+        self._levels: Dict[str, Union[str, int]] = {}
+
     def emit(self, record: logging.LogRecord):
         try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
+            level = self._levels[record.levelname]
+        except KeyError:
+            try:
+                level = logger.level(record.levelname).name
+            except ValueError:
+                level = record.levelno
+            self._levels[record.levelname] = level
+
+        if not self.resolve_caller:
+            # Cheaper than building a patched Logger per record with `logger.patch()`
+            token = _stdlib_record.set(record)
+            try:
+                if record.exc_info:
+                    logger.opt(exception=record.exc_info).log(level, record.getMessage())
+                else:
+                    logger.log(level, record.getMessage())
+            finally:
+                _stdlib_record.reset(token)
+            return
 
         frame, depth = logging.currentframe(), 0
         while frame and frame.f_code.co_filename == logging.__file__:
@@ -19,6 +50,14 @@ class InterceptHandler(logging.Handler):
 
         logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
 
+def _use_stdlib_origin(record) -> None:
+    """Reports the origin of the stdlib record being forwarded, if any."""
+    stdlib_record = _stdlib_record.get()
+    if stdlib_record is not None:
+        record["name"] = stdlib_record.name
+        record["function"] = stdlib_record.funcName
+        record["line"] = stdlib_record.lineno
+
 def trace_context_processor(record):
     """Adds OpenTelemetry trace and span IDs to the log record."""
     span = trace.get_current_span()
@@ -35,6 +74,11 @@ def trace_context_processor(record):
     else:
         record["extra"].setdefault("aws_request_id", "N/A")
 
+def patch_record(record) -> None:
+    """The Loguru patcher installed by `configure_logging`."""
+    trace_context_processor(record)
+    _use_stdlib_origin(record)
+
 def configure_logging():
     """Configures Loguru to be the primary logger."""
     logger.remove()
@@ -56,8 +100,14 @@ def configure_logging():
 
     logger.configure(
         extra={"lambda_context": None}, 
-        patcher=trace_context_processor
+        patcher=patch_record
     )
     
-    logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
+    logging.basicConfig(
+        handlers=[InterceptHandler(resolve_caller=settings.LOG_INTERCEPT_RESOLVE_CALLER)],
+        level=settings.LOG_LEVEL.value,
+        force=True,
+    )
+    for name, level in settings.LOG_LEVEL_OVERRIDES.items():
+        logging.getLogger(name).setLevel(level.value)
     logger.info("Logging configured for Lambda.")
@@ -1,49 +1,101 @@
-from typing import Sequence
+import functools
+import inspect
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Mapping, Optional
 from loguru import logger
 from opentelemetry import trace
-from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
-from opentelemetry.sdk.trace.export import (
-    BatchSpanProcessor,
-    ConsoleSpanExporter,
-    SpanExporter,
-    SpanExportResult,
-)
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
 from .config import settings
 
-class NullSpanExporter(SpanExporter):
-    """A SpanExporter that does nothing, effectively silencing trace output."""
-    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
-        return SpanExportResult.SUCCESS
+tracer = trace.get_tracer(__name__)
 
-    def shutdown(self) -> None:
-        pass
-
-    def force_flush(self, timeout_millis: int = 30000) -> bool:
-        return True
-
-def configure_tracing():
+def configure_tracing() -> bool:
     """
     Configures OpenTelemetry for distributed tracing in the Lambda environment.
+
+    When neither an OTLP endpoint nor console span logging is configured, no
+    SDK is installed and a no-op TracerProvider is used instead, so spans
+    cost almost nothing. Returns True if spans are being recorded.
     """
+    if not settings.OTEL_EXPORTER_OTLP_ENDPOINT and not settings.OTEL_DEBUG_LOG_SPANS:
+        trace.set_tracer_provider(trace.NoOpTracerProvider())
+        logger.info("OpenTelemetry tracing is disabled. No exporter is configured, so spans are not recorded.")
+        return False
+
+    # The SDK and exporters are imported here rather than at module level, so
+    # processes that don't export spans never load them (or gRPC).
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import (
+        BatchSpanProcessor,
+        ConsoleSpanExporter,
+        SpanExporter,
+    )
+
     resource = Resource(attributes={"service.name": settings.OTEL_SERVICE_NAME})
     provider = TracerProvider(resource=resource)
 
     exporter: SpanExporter
     if settings.OTEL_EXPORTER_OTLP_ENDPOINT:
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+
         exporter = OTLPSpanExporter(
             endpoint=settings.OTEL_EXPORTER_OTLP_ENDPOINT, insecure=True
         )
         log_message = f"OpenTelemetry configured with OTLP exporter to {settings.OTEL_EXPORTER_OTLP_ENDPOINT}"
-    elif settings.OTEL_DEBUG_LOG_SPANS:
+    else:
         exporter = ConsoleSpanExporter()
         log_message = "OpenTelemetry configured with ConsoleSpanExporter. Traces will be printed to the console."
-    else:
-        exporter = NullSpanExporter()
-        log_message = "OpenTelemetry tracing is active. Spans are not being exported."
 
     processor = BatchSpanProcessor(exporter)
     provider.add_span_processor(processor)
     trace.set_tracer_provider(provider)
     logger.info(log_message)
+    return True
+
+@contextmanager
+def traced_span(
+    name: str,
+    attributes: Optional[Callable[[], Mapping[str, Any]]] = None,
+    span_tracer: Optional[trace.Tracer] = None,
+) -> Iterator[trace.Span]:
+    """
+    Runs a block inside a new span. `attributes` is only called when the
+    span is recording, so computing them is free when tracing is disabled.
+    """
+    with (span_tracer or tracer).start_as_current_span(name) as span:
+        if attributes is not None and span.is_recording():
+            span.set_attributes(attributes())
+        yield span
+
+def traced(
+    name: Optional[str] = None,
+    attributes: Optional[Callable[..., Mapping[str, Any]]] = None,
+    span_tracer: Optional[trace.Tracer] = None,
+):
+    """
+    Decorator that runs a sync or async function inside a new span.
+    `attributes` is called with the function's arguments, and only when the
+    span is recording.
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+        func_tracer = span_tracer or trace.get_tracer(func.__module__)
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with func_tracer.start_as_current_span(span_name) as span:
+                    if attributes is not None and span.is_recording():
+                        span.set_attributes(attributes(*args, **kwargs))
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with func_tracer.start_as_current_span(span_name) as span:
+                if attributes is not None and span.is_recording():
+                    span.set_attributes(attributes(*args, **kwargs))
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
@@ -1,3 +1,6 @@
+import base64
+from typing import Optional
+
 from loguru import logger
 
 def get_request_username(event: dict) -> str:
@@ -18,3 +21,19 @@ def get_request_username(event: dict) -> str:
         logger.info(f"Found username: {username}")
         
     return username
+
+def get_request_body(event: dict) -> Optional[str]:
+    """
+    Returns the request body as text, or None if there is none.
+
+    Because template.yaml sets `BinaryMediaTypes` to `*/*` (so compressed
+    responses can be returned), API Gateway base64-encodes every request
+    body and sets `isBase64Encoded`. Read bodies through this function
+    rather than `event["body"]` so they are decoded.
+    """
+    body = event.get("body")
+    if body is None:
+        return None
+    if event.get("isBase64Encoded"):
+        return base64.b64decode(body).decode("utf-8")
+    return body
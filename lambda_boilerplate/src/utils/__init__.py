@@ -1,6 +1,11 @@
 """
 This package contains shared utility functions that can be used across the Lambda function.
 """
-from .response_builder import build_success_message
+from .response_builder import (
+    ResponseTooLargeError,
+    accepts_gzip,
+    build_http_response,
+    build_success_message,
+)
 
-__all__ = ["build_success_message"]
+__all__ = ["ResponseTooLargeError", "accepts_gzip", "build_http_response", "build_success_message"]
@@ -1,7 +1,82 @@
+import base64
+import gzip
+from typing import Any, Dict, Optional, Union
+
 from ..core.config import settings
 
+# Lambda rejects synchronous invocation responses larger than 6 MB.
+LAMBDA_MAX_RESPONSE_BYTES = 6 * 1024 * 1024
+
+class ResponseTooLargeError(Exception):
+    """Raised when a response body exceeds the Lambda payload limit, even after compression."""
+
 def build_success_message(name: str) -> str:
     """
     A simple utility to build a standardized success message.
     """
     return f"Hello, {name}! Welcome to {settings.APP_NAME}."
+
+def accepts_gzip(event: dict) -> bool:
+    """
+    Checks the event's Accept-Encoding header for gzip with a non-zero q-value.
+    An explicit `gzip` entry takes precedence over `*`.
+    """
+    headers = event.get("headers") or {}
+    accept_encoding = next(
+        (value for name, value in headers.items() if name.lower() == "accept-encoding"), ""
+    )
+    preferences = {}
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        preferences[coding.strip().lower()] = quality
+    return preferences.get("gzip", preferences.get("*", 0.0)) > 0
+
+def build_http_response(
+    body: Union[str, bytes],
+    event: dict,
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """
+    Builds an API Gateway proxy response for a text body.
+
+    Bodies of at least RESPONSE_COMPRESSION_MIN_SIZE bytes are gzip-compressed
+    when the client accepts gzip. Compressed bodies are base64-encoded and
+    flagged with `isBase64Encoded`. Smaller bodies pass through unchanged.
+    Raises ResponseTooLargeError if the final body exceeds the Lambda limit.
+    """
+    raw = body.encode("utf-8") if isinstance(body, str) else body
+    response_headers = {"Content-Type": "application/json", **(headers or {})}
+
+    if len(raw) >= settings.RESPONSE_COMPRESSION_MIN_SIZE and accepts_gzip(event):
+        compressed = gzip.compress(raw, compresslevel=settings.RESPONSE_GZIP_LEVEL, mtime=0)
+        response_body = base64.b64encode(compressed).decode("ascii")
+        response_headers["Content-Encoding"] = "gzip"
+        response_headers["Vary"] = "Accept-Encoding"
+        is_base64_encoded = True
+        # Base64 output is ASCII, so its length in characters is its size in bytes
+        body_size = len(response_body)
+    else:
+        response_body = raw.decode("utf-8")
+        is_base64_encoded = False
+        body_size = len(raw)
+
+    if body_size > LAMBDA_MAX_RESPONSE_BYTES:
+        raise ResponseTooLargeError(
+            f"Response body is {body_size} bytes; the Lambda limit is {LAMBDA_MAX_RESPONSE_BYTES} bytes."
+        )
+
+    return {
+        "statusCode": status_code,
+        "headers": response_headers,
+        "body": response_body,
+        "isBase64Encoded": is_base64_encoded,
+    }
@@ -0,0 +1,24 @@
+import base64
+import json
+
+from src.functions import get_request_body
+
+
+def test_base64_encoded_body_is_decoded():
+    """Tests that a body API Gateway base64-encoded (BinaryMediaTypes) is returned as text."""
+    payload = json.dumps({"username": "alice"})
+    event = {"body": base64.b64encode(payload.encode("utf-8")).decode("ascii"), "isBase64Encoded": True}
+
+    assert json.loads(get_request_body(event)) == {"username": "alice"}
+
+
+def test_plain_body_passes_through():
+    """Tests that a body that is not base64-encoded is returned unchanged."""
+    event = {"body": '{"username": "alice"}', "isBase64Encoded": False}
+
+    assert get_request_body(event) == '{"username": "alice"}'
+
+
+def test_missing_body_returns_none():
+    """Tests that an event without a body, e.g. a GET, returns None."""
+    assert get_request_body({"isBase64Encoded": False}) is None
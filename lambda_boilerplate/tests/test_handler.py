@@ -1,7 +1,7 @@
 import json
 import unittest.mock as mock
 from src.app import handler
-from src.types.hello import HelloResponse
+from src.schemas import HelloResponse
 
 def test_handler_success():
     """
@@ -47,3 +47,25 @@ def test_handler_no_username():
     body = json.loads(response["body"])
     validated_body = HelloResponse(**body)
     assert "Hello, Guest! Welcome to" in validated_body.message
+
+def test_handler_small_body_is_not_compressed():
+    """
+    Tests that a small response stays uncompressed even when the client accepts gzip.
+    """
+    # Arrange
+    mock_event = {
+        "headers": {"Accept-Encoding": "gzip, deflate"},
+        "queryStringParameters": {"username": "UnitTest"},
+    }
+    mock_context = mock.Mock()
+    mock_context.aws_request_id = "11111-22222"
+
+    # Act
+    response = handler(mock_event, mock_context)
+
+    # Assert
+    assert response["statusCode"] == 200
+    assert response["isBase64Encoded"] is False
+    assert "Content-Encoding" not in response["headers"]
+    validated_body = HelloResponse(**json.loads(response["body"]))
+    assert "Hello, UnitTest! Welcome to" in validated_body.message
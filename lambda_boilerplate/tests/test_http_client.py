@@ -0,0 +1,109 @@
+import httpx
+import pytest
+
+from src.core.config import settings
+from src.core.http_client import CircuitBreaker, CircuitOpenError, HttpClient
+
+
+def make_client(responder, **kwargs) -> HttpClient:
+    """Builds an HttpClient whose requests are answered by `responder` instead of the network."""
+    transport = httpx.MockTransport(responder)
+    return HttpClient(client=httpx.Client(transport=transport), retry_backoff=0, **kwargs)
+
+
+def test_retries_idempotent_request_on_retryable_status():
+    """Tests that a GET is retried after a 503 and returns the later success."""
+    calls = []
+
+    def responder(request):
+        calls.append(request)
+        return httpx.Response(503 if len(calls) == 1 else 200)
+
+    response = make_client(responder).get("http://downstream/resource")
+
+    assert response.status_code == 200
+    assert len(calls) == 2
+
+
+def test_does_not_retry_non_idempotent_request():
+    """Tests that a POST is sent only once, even on a retryable status."""
+    calls = []
+
+    def responder(request):
+        calls.append(request)
+        return httpx.Response(503)
+
+    response = make_client(responder).post("http://downstream/resource", json={"a": 1})
+
+    assert response.status_code == 503
+    assert len(calls) == 1
+
+
+def test_raises_transport_error_after_retries():
+    """Tests that a connection error is retried and re-raised once retries are used up."""
+    calls = []
+
+    def responder(request):
+        calls.append(request)
+        raise httpx.ConnectError("connection refused", request=request)
+
+    with pytest.raises(httpx.ConnectError):
+        make_client(responder, max_retries=2).get("http://downstream/resource")
+
+    assert len(calls) == 3
+
+
+def test_circuit_opens_after_consecutive_failures(monkeypatch):
+    """Tests that the circuit opens per host and rejects calls without sending them."""
+    monkeypatch.setattr(settings, "HTTP_CLIENT_CIRCUIT_FAILURE_THRESHOLD", 2)
+    calls = []
+
+    def responder(request):
+        calls.append(request)
+        return httpx.Response(503 if request.url.host == "flaky" else 200)
+
+    client = make_client(responder, max_retries=0)
+    client.get("http://flaky/resource")
+    client.get("http://flaky/resource")
+
+    with pytest.raises(CircuitOpenError):
+        client.get("http://flaky/resource")
+    assert len(calls) == 2
+    assert client.get("http://healthy/resource").status_code == 200
+
+
+def test_circuit_counts_one_failure_per_call(monkeypatch):
+    """Tests that retries within a call count as a single failure and surface the real error."""
+    monkeypatch.setattr(settings, "HTTP_CLIENT_CIRCUIT_FAILURE_THRESHOLD", 2)
+    calls = []
+
+    def responder(request):
+        calls.append(request)
+        raise httpx.ConnectError("connection refused", request=request)
+
+    client = make_client(responder, max_retries=2)
+    for _ in range(2):
+        with pytest.raises(httpx.ConnectError):
+            client.get("http://flaky/resource")
+
+    with pytest.raises(CircuitOpenError):
+        client.get("http://flaky/resource")
+    assert len(calls) == 6
+
+
+def test_half_open_circuit_lets_a_single_probe_through():
+    """Tests that only the first caller after the reset timeout is let through, and its result decides."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    breaker.reset_timeout = 60
+    assert not breaker.allow_request()
+
+    breaker.reset_timeout = 0
+    assert breaker.allow_request()
+    assert breaker.state == "half_open"
+    breaker.reset_timeout = 60
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow_request()
@@ -0,0 +1,84 @@
+import inspect
+import logging
+
+import pytest
+from loguru import logger
+
+from src.core import logging_config
+from src.core.config import LogLevel, settings
+from src.core.logging_config import InterceptHandler, configure_logging, patch_record
+
+
+@pytest.fixture
+def records():
+    """Collects the Loguru records written while the test runs."""
+    collected = []
+    logger.configure(patcher=patch_record)
+    sink_id = logger.add(lambda message: collected.append(message.record), level="DEBUG")
+    yield collected
+    logger.remove(sink_id)
+
+
+@pytest.fixture
+def stdlib_logger():
+    """A stdlib logger that only goes through the handler under test."""
+    stdlib = logging.getLogger("tests.intercept")
+    stdlib.propagate = False
+    stdlib.setLevel(logging.DEBUG)
+    yield stdlib
+    stdlib.handlers = []
+
+
+@pytest.fixture
+def restore_stdlib_logging():
+    """Undoes the global stdlib logging changes made by configure_logging."""
+    noisy = logging.getLogger("botocore.noisy")
+    yield
+    noisy.setLevel(logging.NOTSET)
+    logging.basicConfig(handlers=[logging.NullHandler()], level=logging.WARNING, force=True)
+
+
+def test_levels_are_looked_up_once_and_cached(stdlib_logger, records):
+    """Tests that known level names map to Loguru names and unknown ones to their number."""
+    handler = InterceptHandler()
+    stdlib_logger.addHandler(handler)
+    logging.addLevelName(25, "NOTICE")
+
+    stdlib_logger.info("first")
+    stdlib_logger.info("second")
+    stdlib_logger.log(25, "custom")
+
+    assert handler._levels == {"INFO": "INFO", "NOTICE": 25}
+    assert [record["level"].no for record in records] == [20, 20, 25]
+
+
+def test_record_origin_reaches_loguru_without_resolving_caller(stdlib_logger, records):
+    """Tests that with resolve_caller=False the stdlib name, function and line are used."""
+    stdlib_logger.addHandler(InterceptHandler(resolve_caller=False))
+
+    logging_line = inspect.currentframe().f_lineno + 1
+    stdlib_logger.warning("from stdlib")
+    logger.info("native")
+
+    stdlib_record, native_record = records
+    assert stdlib_record["name"] == "tests.intercept"
+    assert stdlib_record["function"] == "test_record_origin_reaches_loguru_without_resolving_caller"
+    assert stdlib_record["line"] == logging_line
+    # The context variable is reset, so native records keep their own origin
+    assert native_record["name"] == __name__
+    assert logging_config._stdlib_record.get() is None
+
+
+def test_level_overrides_drop_records_before_loguru(monkeypatch, restore_stdlib_logging):
+    """Tests that LOG_LEVEL_OVERRIDES filters a logger's records in stdlib logging."""
+    monkeypatch.setattr(settings, "LOG_LEVEL_OVERRIDES", {"botocore.noisy": LogLevel.WARNING})
+    configure_logging()
+    records = []
+    sink_id = logger.add(lambda message: records.append(message.record), level="DEBUG")
+
+    noisy = logging.getLogger("botocore.noisy")
+    noisy.info("dropped")
+    noisy.warning("kept")
+    logger.remove(sink_id)
+
+    assert [record["message"] for record in records] == ["kept"]
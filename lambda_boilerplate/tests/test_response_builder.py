@@ -0,0 +1,91 @@
+import base64
+import gzip
+import json
+
+import pytest
+
+from src.utils import response_builder
+from src.utils.response_builder import ResponseTooLargeError, build_http_response
+
+LARGE_BODY = json.dumps([{"id": i, "username": f"user_{i}"} for i in range(500)])
+SMALL_BODY = json.dumps({"message": "Hello"})
+
+
+def decode_body(response: dict) -> str:
+    """Reverses the encoding applied by build_http_response."""
+    if response["isBase64Encoded"]:
+        return gzip.decompress(base64.b64decode(response["body"])).decode("utf-8")
+    return response["body"]
+
+
+def test_large_body_is_gzipped_when_accepted():
+    """Tests that a large body is gzipped, base64-encoded and decodes back to the original."""
+    event = {"headers": {"Accept-Encoding": "gzip, deflate, br"}}
+
+    response = build_http_response(LARGE_BODY, event)
+
+    assert response["statusCode"] == 200
+    assert response["isBase64Encoded"] is True
+    assert response["headers"]["Content-Encoding"] == "gzip"
+    assert response["headers"]["Vary"] == "Accept-Encoding"
+    assert len(response["body"]) < len(LARGE_BODY)
+    assert decode_body(response) == LARGE_BODY
+
+
+def test_small_body_passes_through():
+    """Tests that bodies under the size threshold are sent uncompressed."""
+    event = {"headers": {"accept-encoding": "gzip"}}
+
+    response = build_http_response(SMALL_BODY, event)
+
+    assert response["isBase64Encoded"] is False
+    assert "Content-Encoding" not in response["headers"]
+    assert response["body"] == SMALL_BODY
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        {},
+        {"headers": None},
+        {"headers": {"Accept-Encoding": "br, deflate"}},
+        {"headers": {"Accept-Encoding": "gzip;q=0"}},
+        {"headers": {"Accept-Encoding": "gzip;level=1;q=0"}},
+        {"headers": {"Accept-Encoding": "gzip;q=0, *"}},
+    ],
+)
+def test_large_body_is_not_compressed_without_gzip(event):
+    """Tests that nothing is compressed unless the client accepts gzip."""
+    response = build_http_response(LARGE_BODY, event)
+
+    assert response["isBase64Encoded"] is False
+    assert response["body"] == LARGE_BODY
+
+
+def test_custom_status_and_headers_are_kept():
+    """Tests that the status code and extra headers survive compression."""
+    event = {"headers": {"Accept-Encoding": "*"}}
+
+    response = build_http_response(LARGE_BODY, event, status_code=201, headers={"X-Request-Id": "abc"})
+
+    assert response["statusCode"] == 201
+    assert response["headers"]["X-Request-Id"] == "abc"
+    assert response["headers"]["Content-Type"] == "application/json"
+    assert decode_body(response) == LARGE_BODY
+
+
+def test_body_over_lambda_limit_raises(monkeypatch):
+    """Tests that a body over the Lambda payload limit is rejected."""
+    monkeypatch.setattr(response_builder, "LAMBDA_MAX_RESPONSE_BYTES", 100)
+
+    with pytest.raises(ResponseTooLargeError):
+        build_http_response(LARGE_BODY, {})
+
+
+def test_non_ascii_body_is_measured_in_bytes(monkeypatch):
+    """Tests that the limit counts UTF-8 bytes, not characters, for an uncompressed body."""
+    body = "\u00e9" * 60
+    monkeypatch.setattr(response_builder, "LAMBDA_MAX_RESPONSE_BYTES", 100)
+
+    with pytest.raises(ResponseTooLargeError):
+        build_http_response(body, {})
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from src.core.tracing_config import traced, traced_span
+
+
+@pytest.fixture
+def noop_tracer():
+    return trace.NoOpTracerProvider().get_tracer(__name__)
+
+
+@pytest.fixture
+def exporter():
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def recording_tracer(exporter):
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return provider.get_tracer(__name__)
+
+
+def fail_if_called(*args, **kwargs):
+    raise AssertionError("attributes were computed for a span that is not recording")
+
+
+def test_traced_span_skips_attributes_when_not_recording(noop_tracer):
+    """Tests that the attribute callable is never called with the no-op tracer."""
+    with traced_span("work", fail_if_called, noop_tracer) as span:
+        assert not span.is_recording()
+
+
+def test_traced_span_sets_attributes_when_recording(recording_tracer, exporter):
+    """Tests that the attribute callable's result is set on a recorded span."""
+    with traced_span("work", lambda: {"user.id": 7}, recording_tracer):
+        pass
+
+    [span] = exporter.get_finished_spans()
+    assert span.name == "work"
+    assert span.attributes["user.id"] == 7
+
+
+def test_traced_skips_attributes_when_not_recording(noop_tracer):
+    """Tests that the decorator never calls the attribute callable with the no-op tracer."""
+    @traced("sync_work", fail_if_called, noop_tracer)
+    def sync_work(value):
+        return value * 2
+
+    @traced("async_work", fail_if_called, noop_tracer)
+    async def async_work(value):
+        return value * 3
+
+    assert sync_work(2) == 4
+    assert asyncio.run(async_work(2)) == 6
+
+
+def test_traced_sets_attributes_from_arguments_when_recording(recording_tracer, exporter):
+    """Tests that the decorator passes the call's arguments to the attribute callable."""
+    @traced("sync_work", lambda value: {"work.value": value}, recording_tracer)
+    def sync_work(value):
+        return value * 2
+
+    @traced(attributes=lambda value: {"work.value": value}, span_tracer=recording_tracer)
+    async def async_work(value):
+        return value * 3
+
+    assert sync_work(2) == 4
+    assert asyncio.run(async_work(5)) == 15
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    assert spans["sync_work"].attributes["work.value"] == 2
+    assert spans[async_work.__qualname__].attributes["work.value"] == 5